@@ -1,13 +1,15 @@
-from datetime import datetime
-from difflib import SequenceMatcher
-from flask import Flask, render_template
+from concurrent.futures import Future, ThreadPoolExecutor
+from flask import Flask, request, stream_template
+import hashlib
 import logging
-from multiprocessing import Process
 from multiprocessing.managers import BaseManager
 import os
 import random
 import re
 import sys
+import threading
+import time
+from typing import Union
 
 from ask_sdk_core.skill_builder import SkillBuilder
 from ask_sdk_core.dispatch_components import AbstractRequestHandler, AbstractRequestInterceptor, AbstractResponseInterceptor
@@ -16,6 +18,8 @@ from ask_sdk_core.handler_input import HandlerInput
 from ask_sdk_model import Response
 from ask_sdk_core.dispatch_components import AbstractExceptionHandler
 from flask_ask_sdk.skill_adapter import SkillAdapter
+from rapidfuzz import fuzz
+from waitress import serve
 
 import asknavidrome.subsonic_api as subsonic_api
 import asknavidrome.media_queue as queue
@@ -48,7 +52,7 @@ logger.addHandler(handler)
 # App name - configurable via environment variable, defaults to AskNavidromePlex
 APP_NAME = os.getenv('SKILL_NAME', 'AskNavidromePlex')
 
-logger.info(f'{APP_NAME} 1.0 - Multi-source media player!')
+logger.info('%s 1.0 - Multi-source media player!', APP_NAME)
 logger.debug('Getting configuration from the environment...')
 
 try:
@@ -57,26 +61,30 @@ try:
         # if this is not set the web service will respond to any skill.
         sb.skill_id = os.getenv('NAVI_SKILL_ID')
 
-        logger.info(f'Skill ID set to: {sb.skill_id}')
+        logger.info('Skill ID set to: %s', sb.skill_id)
 
     else:
         raise NameError
 except NameError as err:
-    logger.error(f'The Alexa skill ID was not found! {err}')
+    logger.error('The Alexa skill ID was not found! %s', err)
     raise
 
 # Song count configuration (defaults to 50 if not specified)
-min_song_count = os.getenv('NAVI_SONG_COUNT', '50')
-logger.info(f'Minimum song count is set to: {min_song_count}')
+min_song_count = int(os.getenv('NAVI_SONG_COUNT', '50'))
+logger.info('Minimum song count is set to: %s', min_song_count)
+
+# Songs returned by one source for a single search (the Subsonic search3 default),
+# a longer min_song_count means search results usually need filling with random songs
+SEARCH_PAGE_SIZE = 20
 
 # Feature flags
 enable_navidrome = os.getenv('ENABLE_NAVIDROME', '1').lower() in ('1', 'true', 'yes')
 enable_plex = os.getenv('ENABLE_PLEX', '0').lower() in ('1', 'true', 'yes')
 prefer_high_bitrate = os.getenv('PREFER_HIGH_BITRATE', '0').lower() in ('1', 'true', 'yes')
 
-logger.info(f'Navidrome enabled: {enable_navidrome}')
-logger.info(f'Plex enabled: {enable_plex}')
-logger.info(f'Prefer high bitrate: {prefer_high_bitrate}')
+logger.info('Navidrome enabled: %s', enable_navidrome)
+logger.info('Plex enabled: %s', enable_plex)
+logger.info('Prefer high bitrate: %s', prefer_high_bitrate)
 
 # At least one source must be enabled
 if not enable_navidrome and not enable_plex:
@@ -97,9 +105,9 @@ if enable_navidrome:
         if not all([navidrome_url, navidrome_user, navidrome_passwd]):
             raise ValueError('Missing Navidrome configuration')
 
-        logger.info(f'Navidrome URL: {navidrome_url}')
-        logger.info(f'Navidrome user: {navidrome_user}')
-        logger.info(f'Navidrome port: {navidrome_port}')
+        logger.info('Navidrome URL: %s', navidrome_url)
+        logger.info('Navidrome user: %s', navidrome_user)
+        logger.info('Navidrome port: %s', navidrome_port)
 
         navidrome_connection = subsonic_api.SubsonicConnection(
             navidrome_url,
@@ -112,7 +120,7 @@ if enable_navidrome:
         navidrome_connection.ping()
         logger.info('Successfully connected to Navidrome')
     except Exception as e:
-        logger.error(f'Failed to connect to Navidrome: {e}')
+        logger.error('Failed to connect to Navidrome: %s', e)
         if not enable_plex:
             raise RuntimeError('Could not connect to Navidrome and Plex is not enabled!')
 
@@ -129,14 +137,14 @@ if enable_plex:
         if not all([plex_url, plex_token]):
             raise ValueError('Missing Plex configuration (PLEX_URL, PLEX_TOKEN)')
 
-        logger.info(f'Plex URL: {plex_url}')
-        logger.info(f'Plex port: {plex_port}')
+        logger.info('Plex URL: %s', plex_url)
+        logger.info('Plex port: %s', plex_port)
 
         plex_connection = PlexConnection(plex_url, plex_token, plex_port)
         plex_connection.ping()
         logger.info('Successfully connected to Plex')
     except Exception as e:
-        logger.error(f'Failed to connect to Plex: {e}')
+        logger.error('Failed to connect to Plex: %s', e)
         if not navidrome_connection:
             raise RuntimeError('Could not connect to Plex and Navidrome is not available!')
 
@@ -155,22 +163,18 @@ logger.debug('Configuration has been successfully loaded')
 # Set log level based on config value
 navidrome_log_level = int(os.getenv('NAVI_DEBUG', '1'))
 
-if navidrome_log_level == 0:
-    logger.setLevel(logging.WARNING)
-    logger.warning('Log level set to WARNING')
-elif navidrome_log_level == 1:
-    logger.setLevel(logging.INFO)
-    logger.info('Log level set to INFO')
-elif navidrome_log_level == 2:
-    logger.setLevel(logging.DEBUG)
-    logger.debug('Log level set to DEBUG')
-elif navidrome_log_level == 3:
-    logger.setLevel(logging.DEBUG)
-    logger.debug('Log level set to DEBUG')
-else:
+LOG_LEVELS = {
+    0: logging.WARNING,
+    1: logging.INFO,
+    2: logging.DEBUG,
+    3: logging.DEBUG
+}
+
+if navidrome_log_level not in LOG_LEVELS:
     navidrome_log_level = 0
-    logger.setLevel(logging.WARNING)
-    logger.warning('Log level set to WARNING')
+
+logger.setLevel(LOG_LEVELS[navidrome_log_level])
+logger.log(LOG_LEVELS[navidrome_log_level], 'Log level set to %s', logging.getLevelName(LOG_LEVELS[navidrome_log_level]))
 
 # Create a shareable queue than can be updated by multiple threads to enable larger playlists
 # to be returned in the back ground avoiding the Amazon 8 second timeout
@@ -180,12 +184,51 @@ manager.start()
 play_queue = manager.MediaQueue()
 logger.debug('MediaQueue object created...')
 
-# Variable to store the additional thread used to populate large playlists
-# this is used to avoid concurrency issues if there is an attempt to load multiple playlists
-# at the same time.
-backgroundProcess = None
+# Launch requests only re-check the media servers if the last check is older than this,
+# the servers have just been checked while loading the configuration
+PING_INTERVAL = 60
+last_ping_time = time.monotonic()
+
+# Replacements for characters that are reserved in SSML, applied in a single pass
+SSML_TRANSLATION = str.maketrans({
+    '&': 'and',
+    '/': 'and',
+    '\\': 'and',
+    '"': None,
+    "'": None,
+    '<': None,
+    '>': None
+})
+
+# Used to strip punctuation from artist names when matching songs to an artist
+NON_ALPHANUMERIC_RE = re.compile(r'[^a-z0-9\s]')
+
+# Single long lived worker thread used to populate large playlists, jobs run one
+# at a time to avoid concurrency issues if there is an attempt to load multiple
+# playlists at the same time.
+enqueue_executor = ThreadPoolExecutor(max_workers=1)
+
+# Threads used to overlap independent media server requests within a single request
+request_executor = ThreadPoolExecutor(max_workers=4)
+
+# The background enqueue job currently running and the event used to cancel it,
+# requests are handled on several threads so both are only used with enqueue_lock held
+enqueue_job = None
+enqueue_cancel = threading.Event()
+enqueue_lock = threading.Lock()
+
+logger.info('%s Web Service is ready to start!', APP_NAME)
+
+
+#
+# Request predicates, built once rather than on every can_handle() call
+#
 
-logger.info(f'{APP_NAME} Web Service is ready to start!')
+IS_LAUNCH_REQUEST = is_request_type('LaunchRequest')
+IS_SESSION_ENDED_REQUEST = is_request_type('SessionEndedRequest')
+IS_SYSTEM_EXCEPTION_ENCOUNTERED = is_request_type('System.ExceptionEncountered')
+
+IS_AMAZON_NAVIGATE_HOME_INTENT = is_intent_name('AMAZON.NavigateHomeIntent')
 
 
 def build_card_data(speech: str, track_details=None) -> dict:
@@ -204,8 +247,8 @@ def build_card_data(speech: str, track_details=None) -> dict:
     }
     
     if track_details:
-        card['art_url'] = getattr(track_details, 'cover_art_url', None)
-        card['background_url'] = getattr(track_details, 'background_url', None)
+        card['art_url'] = track_details.cover_art_url
+        card['background_url'] = track_details.background_url
     
     return card
 
@@ -214,20 +257,48 @@ def build_card_data(speech: str, track_details=None) -> dict:
 # Handler Classes
 #
 
+class DispatchedRequestHandler(AbstractRequestHandler):
+    """Base class for handlers routed by RequestDispatchHandler
+
+    Subclasses declare the intent names and request types they handle, the
+    dispatch tables are built from these declarations and can_handle()
+    answers from them too, so routing is only declared in one place.
+    """
+
+    intent_names: tuple = ()
+    """Intent names handled when the request is an IntentRequest"""
+
+    request_types: tuple = ()
+    """Other request types handled, e.g. AudioPlayer events"""
+
+    def can_handle(self, handler_input: HandlerInput) -> bool:
+        request_type = get_request_type(handler_input)
+
+        if request_type == 'IntentRequest':
+            return get_intent_name(handler_input) in self.intent_names
+
+        return request_type in self.request_types
+
+
 class LaunchRequestHandler(AbstractRequestHandler):
     """Handle LaunchRequest and NavigateHomeIntent"""
 
     def can_handle(self, handler_input: HandlerInput) -> bool:
         return (
-            is_request_type('LaunchRequest')(handler_input) or
-            is_intent_name('AMAZON.NavigateHomeIntent')(handler_input)
+            IS_LAUNCH_REQUEST(handler_input) or
+            IS_AMAZON_NAVIGATE_HOME_INTENT(handler_input)
         )
 
     def handle(self, handler_input: HandlerInput) -> Response:
+        global last_ping_time
         logger.debug('In LaunchRequestHandler')
 
-        connection.ping()
-        speech = sanitise_speech_output('Ready!')
+        # Avoid a round trip to every media server on each launch
+        if time.monotonic() - last_ping_time > PING_INTERVAL:
+            connection.ping()
+            last_ping_time = time.monotonic()
+
+        speech = SPEECH_READY
 
         handler_input.response_builder.speak(speech).ask(speech)
         return handler_input.response_builder.response
@@ -242,9 +313,11 @@ class CheckAudioInterfaceHandler(AbstractRequestHandler):
     """
 
     def can_handle(self, handler_input: HandlerInput) -> bool:
-        if handler_input.request_envelope.context.system.device:
+        device = handler_input.request_envelope.context.system.device
+
+        if device:
             # Since skill events won't have device information
-            return handler_input.request_envelope.context.system.device.supported_interfaces.audio_player is None
+            return device.supported_interfaces.audio_player is None
         else:
             return False
 
@@ -267,7 +340,7 @@ class SkillEventHandler(AbstractRequestHandler):
     def can_handle(self, handler_input: HandlerInput) -> bool:
         return (handler_input.request_envelope.request.object_type.startswith(
                 'AlexaSkillEvent') or
-                is_request_type('SessionEndedRequest')(handler_input))
+                IS_SESSION_ENDED_REQUEST(handler_input))
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In SkillEventHandler')
@@ -275,22 +348,21 @@ class SkillEventHandler(AbstractRequestHandler):
         return handler_input.response_builder.response
 
 
-class HelpHandler(AbstractRequestHandler):
+class HelpHandler(DispatchedRequestHandler):
     """Handle HelpIntent"""
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('AMAZON.HelpIntent')(handler_input)
+    intent_names = ('AMAZON.HelpIntent',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In HelpHandler')
 
-        text = sanitise_speech_output(f'{APP_NAME} lets you interact with media servers that offer a Subsonic compatible A.P.I.')
+        text = SPEECH_HELP
         handler_input.response_builder.speak(text)
 
         return handler_input.response_builder.response
 
 
-class FallbackIntentHandler(AbstractRequestHandler):
+class FallbackIntentHandler(DispatchedRequestHandler):
     """Handle AMAZON.FallbackIntent
 
     This is triggered when Alexa doesn't understand the user's request,
@@ -298,36 +370,30 @@ class FallbackIntentHandler(AbstractRequestHandler):
     We respond with "Ready!" to indicate the skill is listening.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('AMAZON.FallbackIntent')(handler_input)
+    intent_names = ('AMAZON.FallbackIntent',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In FallbackIntentHandler')
 
-        speech = sanitise_speech_output('Ready!')
+        speech = SPEECH_READY
         handler_input.response_builder.speak(speech).ask(speech)
 
         return handler_input.response_builder.response
 
 
-class NaviSonicPlayMusicByArtist(AbstractRequestHandler):
+class NaviSonicPlayMusicByArtist(DispatchedRequestHandler):
     """Handle NaviSonicPlayMusicByArtist
 
     Play a selection of songs for the given artist
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicPlayMusicByArtist')(handler_input)
+    intent_names = ('NaviSonicPlayMusicByArtist',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        global backgroundProcess
         logger.debug('In NaviSonicPlayMusicByArtist')
 
-        # Check if a background process is already running, if it is then terminate the process
-        # in favour of the new process.
-        if backgroundProcess is not None:
-            backgroundProcess.terminate()
-            backgroundProcess.join()
+        # Stop any background job still enqueuing a previous playlist
+        stop_background_enqueue()
 
         # Get the requested artist
         artist = get_slot_value_v2(handler_input, 'artist')
@@ -350,40 +416,32 @@ class NaviSonicPlayMusicByArtist(AbstractRequestHandler):
 
             # Build a list of songs to play
             song_id_list = connection.build_song_list_from_albums(artist_album_lookup, min_song_count, source)
-            play_queue.clear()
 
-            controller.enqueue_songs(connection, play_queue, [song_id_list[0], song_id_list[1]], source)  # When generating the playlist return the first two tracks.
-            backgroundProcess = Process(target=queue_worker_thread, args=(connection, play_queue, song_id_list[2:], source))  # Create a thread to enqueue the remaining tracks
-            backgroundProcess.start()  # Start the additional thread
+            # When generating the playlist return the first two tracks.
+            track_details = controller.start_new_queue(connection, play_queue, song_id_list[:2], source, shuffle=True)
+            start_background_enqueue(song_id_list[2:], source)  # Enqueue the remaining tracks in the background
 
             speech = sanitise_speech_output(f'Playing music by: {truncate_for_speech(artist.value, max_length=50)}')
             logger.info(speech)
 
-            play_queue.shuffle()
-            track_details = play_queue.get_next_track()
             card = build_card_data(speech, track_details)
 
             return controller.start_playback('play', speech, card, track_details, handler_input)
 
 
-class NaviSonicPlayAlbumByArtist(AbstractRequestHandler):
+class NaviSonicPlayAlbumByArtist(DispatchedRequestHandler):
     """Handle NaviSonicPlayAlbumByArtist
 
     Play a given album by a given artist
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicPlayAlbumByArtist')(handler_input)
+    intent_names = ('NaviSonicPlayAlbumByArtist',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        global backgroundProcess
         logger.debug('In NaviSonicPlayAlbumByArtist')
 
-        # Check if a background process is already running, if it is then terminate the process
-        # in favour of the new process.
-        if backgroundProcess is not None:
-            backgroundProcess.terminate()
-            backgroundProcess.join()
+        # Stop any background job still enqueuing a previous playlist
+        stop_background_enqueue()
 
         # Get variables from intent
         artist = get_slot_value_v2(handler_input, 'artist')
@@ -391,7 +449,7 @@ class NaviSonicPlayAlbumByArtist(AbstractRequestHandler):
 
         if artist is not None and album is not None:
             # Play album by artist method
-            logger.debug(f'Searching for the album {album.value} by {artist.value}')
+            logger.debug('Searching for the album %s by %s', album.value, artist.value)
 
             # Search for an artist
             artist_lookup = connection.search_artist(artist.value)
@@ -408,7 +466,8 @@ class NaviSonicPlayAlbumByArtist(AbstractRequestHandler):
 
                 # Search the list of dictionaries for the requested album
                 # Strings are all converted to lower case to minimise matching errors
-                result = [album_result for album_result in artist_album_lookup if album_result.get('name', '').lower() == album.value.lower()]
+                album_lc = album.value.lower()
+                result = [album_result for album_result in artist_album_lookup if album_result['name_lc'] == album_lc]
 
                 if not result:
                     text = sanitise_speech_output(f"I couldn't find an album called {album.value} by {artist.value} in the collection.")
@@ -418,23 +477,20 @@ class NaviSonicPlayAlbumByArtist(AbstractRequestHandler):
 
                 # At this point we have found an album that matches
                 song_id_list = connection.build_song_list_from_albums(result, -1, source)
-                play_queue.clear()
 
                 # Work around the Amazon / Alexa 8 second timeout.
-                controller.enqueue_songs(connection, play_queue, [song_id_list[0], song_id_list[1]], source)  # When generating the playlist return the first two tracks.
-                backgroundProcess = Process(target=queue_worker_thread, args=(connection, play_queue, song_id_list[2:], source))  # Create a thread to enqueue the remaining tracks
-                backgroundProcess.start()  # Start the additional thread
+                track_details = controller.start_new_queue(connection, play_queue, song_id_list[:2], source)  # When generating the playlist return the first two tracks.
+                start_background_enqueue(song_id_list[2:], source)  # Enqueue the remaining tracks in the background
 
                 speech = sanitise_speech_output(f'Playing {truncate_for_speech(album.value, max_length=50)} by: {truncate_for_speech(artist.value, max_length=40)}')
                 logger.info(speech)
-                track_details = play_queue.get_next_track()
                 card = build_card_data(speech, track_details)
 
                 return controller.start_playback('play', speech, card, track_details, handler_input)
 
         elif artist is None and album:
             # Play album method
-            logger.debug(f'Searching for the album {album.value}')
+            logger.debug('Searching for the album %s', album.value)
 
             result = connection.search_album(album.value)
 
@@ -447,39 +503,38 @@ class NaviSonicPlayAlbumByArtist(AbstractRequestHandler):
             else:
                 source = result[0].get('source', 'navidrome')
                 song_id_list = connection.build_song_list_from_albums(result, -1, source)
-                play_queue.clear()
 
                 # Work around the Amazon / Alexa 8 second timeout.
-                controller.enqueue_songs(connection, play_queue, [song_id_list[0], song_id_list[1]], source)  # When generating the playlist return the first two tracks.
-                backgroundProcess = Process(target=queue_worker_thread, args=(connection, play_queue, song_id_list[2:], source))  # Create a thread to enqueue the remaining tracks
-                backgroundProcess.start()  # Start the additional thread
+                track_details = controller.start_new_queue(connection, play_queue, song_id_list[:2], source)  # When generating the playlist return the first two tracks.
+                start_background_enqueue(song_id_list[2:], source)  # Enqueue the remaining tracks in the background
 
                 speech = sanitise_speech_output(f'Playing {truncate_for_speech(album.value, max_length=60)}')
                 logger.info(speech)
-                track_details = play_queue.get_next_track()
                 card = build_card_data(speech, track_details)
 
                 return controller.start_playback('play', speech, card, track_details, handler_input)
 
 
-class NaviSonicPlaySongByArtist(AbstractRequestHandler):
+class NaviSonicPlaySongByArtist(DispatchedRequestHandler):
     """Handle the NaviSonicPlaySongByArtist intent
 
     Play the given song by the given artist if it exists in the
     collection.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicPlaySongByArtist')(handler_input)
+    intent_names = ('NaviSonicPlaySongByArtist',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicPlaySongByArtist')
 
+        # Stop any background job still enqueuing a previous playlist
+        stop_background_enqueue()
+
         # Get variables from intent
         artist = get_slot_value_v2(handler_input, 'artist')
         song = get_slot_value_v2(handler_input, 'song')
 
-        logger.debug(f'Searching for the song {song.value} by {artist.value}')
+        logger.debug('Searching for the song %s by %s', song.value, artist.value)
 
         # Search for the artist
         artist_lookup = connection.search_artist(artist.value)
@@ -505,36 +560,27 @@ class NaviSonicPlaySongByArtist(AbstractRequestHandler):
             # Search for song by given artist using fuzzy matching
             # The artist name from voice may not exactly match (e.g., "huntrix" vs "HUNTR/X")
             normalized_artist = artist.value.lower().strip()
+            clean_search = NON_ALPHANUMERIC_RE.sub('', normalized_artist)
             matching_songs = []
-            
+
+            # Search results usually contain several songs by the same artist,
+            # remember the match decision for each artist name so the string
+            # cleaning and fuzzy matching run once per artist instead of per song
+            artist_matches = {}
+
             for item in song_list:
-                item_artist = item.get('artist', '').lower()
-                item_original_artist = item.get('originalArtist', '').lower()
-                item_artist_id = item.get('artistId')
-                
                 # Check for exact artistId match
-                if item_artist_id == artist_id:
+                if item.get('artistId') == artist_id:
                     matching_songs.append((item.get('id'), item.get('source', 'navidrome')))
                     continue
-                
-                # Check if search term is contained in artist name (substring match)
-                if normalized_artist in item_artist or normalized_artist in item_original_artist:
-                    matching_songs.append((item.get('id'), item.get('source', 'navidrome')))
-                    continue
-                
-                # Check if artist name starts with or contains key part of search term
-                # Handle cases like "huntrix" matching "HUNTR/X (Ejae, AUDREY NUNA & REI AMI)"
-                # Remove special characters for comparison
-                clean_artist = re.sub(r'[^a-z0-9\s]', '', item_artist)
-                clean_search = re.sub(r'[^a-z0-9\s]', '', normalized_artist)
-                
-                if clean_search in clean_artist or clean_artist.startswith(clean_search):
-                    matching_songs.append((item.get('id'), item.get('source', 'navidrome')))
-                    continue
-                
-                # Fuzzy match as last resort
-                similarity = SequenceMatcher(None, clean_search, clean_artist.split()[0] if clean_artist else '').ratio()
-                if similarity > 0.7:
+
+                artist_key = (item.get('artist', ''), item.get('originalArtist', ''))
+                matched = artist_matches.get(artist_key)
+
+                if matched is None:
+                    matched = artist_matches[artist_key] = artist_name_matches(normalized_artist, clean_search, *artist_key)
+
+                if matched:
                     matching_songs.append((item.get('id'), item.get('source', 'navidrome')))
 
             if not matching_songs:
@@ -543,46 +589,44 @@ class NaviSonicPlaySongByArtist(AbstractRequestHandler):
 
                 return handler_input.response_builder.response
 
-            play_queue.clear()
             # Use the first match's source
             song_source = matching_songs[0][1] if matching_songs else source
             song_ids = [m[0] for m in matching_songs]
-            controller.enqueue_songs(connection, play_queue, song_ids, song_source)
+            track_details = controller.start_new_queue(connection, play_queue, song_ids, song_source)
 
             # Truncate for speech to avoid overly long announcements
             speech_song = truncate_for_speech(song.value, max_length=50)
             speech_artist = truncate_for_speech(artist.value, max_length=40)
             speech = sanitise_speech_output(f'Playing {speech_song} by {speech_artist}')
             logger.info(speech)
-            track_details = play_queue.get_next_track()
             card = build_card_data(speech, track_details)
 
             return controller.start_playback('play', speech, card, track_details, handler_input)
 
 
-class NaviSonicPlaySongFromAlbum(AbstractRequestHandler):
+class NaviSonicPlaySongFromAlbum(DispatchedRequestHandler):
     """Handle NaviSonicPlaySongFromAlbum Intent
 
     Play a song from a specific album
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicPlaySongFromAlbum')(handler_input)
+    intent_names = ('NaviSonicPlaySongFromAlbum',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        global backgroundProcess
         logger.debug('In NaviSonicPlaySongFromAlbum')
 
-        # Check if a background process is already running
-        if backgroundProcess is not None:
-            backgroundProcess.terminate()
-            backgroundProcess.join()
+        # Stop any background job still enqueuing a previous playlist
+        stop_background_enqueue()
 
         # Get the requested song and album
         song = get_slot_value_v2(handler_input, 'song')
         album = get_slot_value_v2(handler_input, 'album')
 
-        logger.debug(f'Searching for song: {song.value} from album: {album.value}')
+        logger.debug('Searching for song: %s from album: %s', song.value, album.value)
+
+        # Random songs are used to fill up short search results, fetch them
+        # while the search runs rather than after it
+        random_future = prefetch_random_songs()
 
         # Search for the song with album context
         song_list = connection.search_song_from_album(song.value, album.value)
@@ -590,6 +634,7 @@ class NaviSonicPlaySongFromAlbum(AbstractRequestHandler):
         if song_list is None or len(song_list) == 0:
             text = sanitise_speech_output(f"I couldn't find the song {song.value} from the album {album.value} in the collection.")
             handler_input.response_builder.speak(text).ask(text)
+            cancel_prefetch(random_future)
             return handler_input.response_builder.response
 
         # Get the best match (first result after sorting)
@@ -599,73 +644,46 @@ class NaviSonicPlaySongFromAlbum(AbstractRequestHandler):
         song_album = best_match.get('album', album.value)
 
         # Build list of song IDs with their sources from search results
-        song_id_list = []
-        search_song_ids = set()
-        for song_item in song_list[:int(min_song_count)]:
-            song_id = song_item.get('id')
-            source = song_item.get('source', 'navidrome')
-            song_id_list.append((song_id, source))
-            search_song_ids.add(song_id)
+        song_id_list = [(song_item.get('id'), song_item.get('source', 'navidrome')) for song_item in song_list[:min_song_count]]
 
         # If we don't have enough songs, fill up with random songs
-        target_count = int(min_song_count)
-        if len(song_id_list) < target_count:
-            remaining_count = target_count - len(song_id_list)
-            logger.debug(f'Search returned {len(song_id_list)} songs, filling remaining {remaining_count} with random songs')
-
-            random_songs = connection.build_random_song_list(remaining_count * 2)
-            if random_songs:
-                for random_song in random_songs:
-                    if len(song_id_list) >= target_count:
-                        break
-                    if isinstance(random_song, tuple):
-                        r_id, r_source = random_song
-                    else:
-                        r_id, r_source = random_song, 'navidrome'
-                    if r_id not in search_song_ids:
-                        song_id_list.append((r_id, r_source))
-                        search_song_ids.add(r_id)
-
-        play_queue.clear()
+        if len(song_id_list) < min_song_count:
+            logger.debug('Search returned %s songs, filling remaining %s with random songs', len(song_id_list), min_song_count - len(song_id_list))
+            random_songs = random_future.result() if random_future else connection.build_random_song_list(min_song_count * 2)
+            song_id_list = fill_song_id_list(song_id_list, random_songs, min_song_count)
+        else:
+            cancel_prefetch(random_future)
 
         # Enqueue first two tracks immediately (8-second timeout workaround)
-        initial_songs = song_id_list[:2] if len(song_id_list) >= 2 else song_id_list
-        remaining_songs = song_id_list[2:] if len(song_id_list) > 2 else []
+        initial_songs = song_id_list[:2]
+        remaining_songs = song_id_list[2:]
 
-        controller.enqueue_songs(connection, play_queue, initial_songs)
-        if remaining_songs:
-            backgroundProcess = Process(target=queue_worker_thread, args=(connection, play_queue, remaining_songs))
-            backgroundProcess.start()
+        track_details = controller.start_new_queue(connection, play_queue, initial_songs)
+        start_background_enqueue(remaining_songs)  # Enqueue the remaining tracks in the background
 
         # Truncate for speech to avoid overly long announcements
         speech_title = truncate_for_speech(song_title, max_length=50)
         speech_album = truncate_for_speech(song_album, max_length=40)
         speech = sanitise_speech_output(f'Playing {speech_title} from {speech_album}')
         logger.info(speech)
-        track_details = play_queue.get_next_track()
         card = build_card_data(speech, track_details)
 
         return controller.start_playback('play', speech, card, track_details, handler_input)
 
 
-class NaviSonicPlayPlaylist(AbstractRequestHandler):
+class NaviSonicPlayPlaylist(DispatchedRequestHandler):
     """Handle NaviSonicPlayPlaylist
 
     Play the given playlist
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicPlayPlaylist')(handler_input)
+    intent_names = ('NaviSonicPlayPlaylist',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        global backgroundProcess
         logger.debug('In NaviSonicPlayPlaylist')
 
-        # Check if a background process is already running, if it is then terminate the process
-        # in favour of the new process.
-        if backgroundProcess is not None:
-            backgroundProcess.terminate()
-            backgroundProcess.join()
+        # Stop any background job still enqueuing a previous playlist
+        stop_background_enqueue()
 
         # Get the requested playlist
         playlist = get_slot_value_v2(handler_input, 'playlist')
@@ -682,39 +700,31 @@ class NaviSonicPlayPlaylist(AbstractRequestHandler):
         else:
             playlist_id, source = playlist_result
             song_id_list = connection.build_song_list_from_playlist(playlist_id, source)
-            play_queue.clear()
 
             # Work around the Amazon / Alexa 8 second timeout.
-            controller.enqueue_songs(connection, play_queue, [song_id_list[0], song_id_list[1]], source)  # When generating the playlist return the first two tracks.
-            backgroundProcess = Process(target=queue_worker_thread, args=(connection, play_queue, song_id_list[2:], source))  # Create a thread to enqueue the remaining tracks
-            backgroundProcess.start()  # Start the additional thread
+            track_details = controller.start_new_queue(connection, play_queue, song_id_list[:2], source)  # When generating the playlist return the first two tracks.
+            start_background_enqueue(song_id_list[2:], source)  # Enqueue the remaining tracks in the background
 
             speech = sanitise_speech_output('Playing playlist ' + str(playlist.value))
             logger.info(speech)
-            track_details = play_queue.get_next_track()
             card = build_card_data(speech, track_details)
 
             return controller.start_playback('play', speech, card, track_details, handler_input)
 
 
-class NaviSonicShufflePlaylist(AbstractRequestHandler):
+class NaviSonicShufflePlaylist(DispatchedRequestHandler):
     """Handle NaviSonicShufflePlaylist
 
     Shuffle and play the given playlist
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicShufflePlaylist')(handler_input)
+    intent_names = ('NaviSonicShufflePlaylist',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        global backgroundProcess
         logger.debug('In NaviSonicShufflePlaylist')
 
-        # Check if a background process is already running, if it is then terminate the process
-        # in favour of the new process.
-        if backgroundProcess is not None:
-            backgroundProcess.terminate()
-            backgroundProcess.join()
+        # Stop any background job still enqueuing a previous playlist
+        stop_background_enqueue()
 
         # Get the requested playlist
         playlist = get_slot_value_v2(handler_input, 'playlist')
@@ -740,44 +750,34 @@ class NaviSonicShufflePlaylist(AbstractRequestHandler):
             # Shuffle the song list
             random.shuffle(song_id_list)
 
-            play_queue.clear()
-
             # Work around the Amazon / Alexa 8 second timeout.
             # Handle playlists with fewer than 2 songs
-            initial_songs = song_id_list[:2] if len(song_id_list) >= 2 else song_id_list
-            remaining_songs = song_id_list[2:] if len(song_id_list) > 2 else []
+            initial_songs = song_id_list[:2]
+            remaining_songs = song_id_list[2:]
 
-            controller.enqueue_songs(connection, play_queue, initial_songs, source)
-            if remaining_songs:
-                backgroundProcess = Process(target=queue_worker_thread, args=(connection, play_queue, remaining_songs, source))
-                backgroundProcess.start()
+            track_details = controller.start_new_queue(connection, play_queue, initial_songs, source)
+            start_background_enqueue(remaining_songs, source)  # Enqueue the remaining tracks in the background
 
             speech = sanitise_speech_output('Shuffling and playing playlist ' + str(playlist.value))
             logger.info(speech)
-            track_details = play_queue.get_next_track()
             card = build_card_data(speech, track_details)
 
             return controller.start_playback('play', speech, card, track_details, handler_input)
 
 
-class NaviSonicPlayMusicByGenre(AbstractRequestHandler):
+class NaviSonicPlayMusicByGenre(DispatchedRequestHandler):
     """ Play songs from the given genre
 
     50 tracks from the given genre are shuffled and played
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicPlayMusicByGenre')(handler_input)
+    intent_names = ('NaviSonicPlayMusicByGenre',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        global backgroundProcess
         logger.debug('In NaviSonicPlayMusicByGenre')
 
-        # Check if a background process is already running, if it is then terminate the process
-        # in favour of the new process.
-        if backgroundProcess is not None:
-            backgroundProcess.terminate()
-            backgroundProcess.join()
+        # Stop any background job still enqueuing a previous playlist
+        stop_background_enqueue()
 
         # Get the requested genre
         genre = get_slot_value_v2(handler_input, 'genre')
@@ -792,40 +792,32 @@ class NaviSonicPlayMusicByGenre(AbstractRequestHandler):
 
         else:
             random.shuffle(song_id_list)
-            play_queue.clear()
 
             # Work around the Amazon / Alexa 8 second timeout.
             # song_id_list contains (id, source) tuples
-            controller.enqueue_songs(connection, play_queue, song_id_list[:2])  # When generating the playlist return the first two tracks.
-            backgroundProcess = Process(target=queue_worker_thread, args=(connection, play_queue, song_id_list[2:]))  # Create a thread to enqueue the remaining tracks
-            backgroundProcess.start()  # Start the additional thread
+            track_details = controller.start_new_queue(connection, play_queue, song_id_list[:2])  # When generating the playlist return the first two tracks.
+            start_background_enqueue(song_id_list[2:])  # Enqueue the remaining tracks in the background
 
             speech = sanitise_speech_output(f'Playing {genre.value} music')
             logger.info(speech)
-            track_details = play_queue.get_next_track()
             card = build_card_data(speech, track_details)
 
             return controller.start_playback('play', speech, card, track_details, handler_input)
 
 
-class NaviSonicPlayMusicRandom(AbstractRequestHandler):
+class NaviSonicPlayMusicRandom(DispatchedRequestHandler):
     """Handle the NaviSonicPlayMusicRandom intent
 
     Play a random selection of music.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicPlayMusicRandom')(handler_input)
+    intent_names = ('NaviSonicPlayMusicRandom',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        global backgroundProcess
         logger.debug('In NaviSonicPlayMusicRandom')
 
-        # Check if a background process is already running, if it is then terminate the process
-        # in favour of the new process.
-        if backgroundProcess is not None:
-            backgroundProcess.terminate()
-            backgroundProcess.join()
+        # Stop any background job still enqueuing a previous playlist
+        stop_background_enqueue()
 
         song_id_list = connection.build_random_song_list(min_song_count)
 
@@ -835,100 +827,86 @@ class NaviSonicPlayMusicRandom(AbstractRequestHandler):
                 min_song_count,
                 song_id_list,
             )
-            text = sanitise_speech_output("I couldn't find any songs in the collection.")
+            text = SPEECH_NO_SONGS
             handler_input.response_builder.speak(text).ask(text)
 
             return handler_input.response_builder.response
 
         else:
             random.shuffle(song_id_list)
-            play_queue.clear()
 
             # Work around the Amazon / Alexa 8 second timeout.
             # song_id_list contains (id, source) tuples
-            controller.enqueue_songs(connection, play_queue, song_id_list[:2])  # When generating the playlist return the first two tracks.
-            backgroundProcess = Process(target=queue_worker_thread, args=(connection, play_queue, song_id_list[2:]))  # Create a thread to enqueue the remaining tracks
-            backgroundProcess.start()  # Start the additional thread
+            track_details = controller.start_new_queue(connection, play_queue, song_id_list[:2])  # When generating the playlist return the first two tracks.
+            start_background_enqueue(song_id_list[2:])  # Enqueue the remaining tracks in the background
 
-            speech = sanitise_speech_output('Playing random music')
+            speech = SPEECH_PLAYING_RANDOM
             logger.info(speech)
-            track_details = play_queue.get_next_track()
             card = build_card_data(speech, track_details)
 
             return controller.start_playback('play', speech, card, track_details, handler_input)
 
 
-class NaviSonicPlayFavouriteSongs(AbstractRequestHandler):
+class NaviSonicPlayFavouriteSongs(DispatchedRequestHandler):
     """Handle the NaviSonicPlayFavouriteSongs intent
 
     Play all starred / liked songs, songs are automatically shuffled.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicPlayFavouriteSongs')(handler_input)
+    intent_names = ('NaviSonicPlayFavouriteSongs',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        global backgroundProcess
         logger.debug('In NaviSonicPlayFavouriteSongs')
 
-        # Check if a background process is already running, if it is then terminate the process
-        # in favour of the new process.
-        if backgroundProcess is not None:
-            backgroundProcess.terminate()
-            backgroundProcess.join()
+        # Stop any background job still enqueuing a previous playlist
+        stop_background_enqueue()
 
         song_id_list = connection.build_song_list_from_favourites()
 
         if song_id_list is None or len(song_id_list) == 0:
-            text = sanitise_speech_output("You don't have any favourite songs in the collection.")
+            text = SPEECH_NO_FAVOURITES
             handler_input.response_builder.speak(text).ask(text)
 
             return handler_input.response_builder.response
 
         else:
             random.shuffle(song_id_list)
-            play_queue.clear()
 
             # Work around the Amazon / Alexa 8 second timeout.
             # song_id_list contains (id, source) tuples
-            controller.enqueue_songs(connection, play_queue, song_id_list[:2])  # When generating the playlist return the first two tracks.
-            backgroundProcess = Process(target=queue_worker_thread, args=(connection, play_queue, song_id_list[2:]))  # Create a thread to enqueue the remaining tracks
-            backgroundProcess.start()  # Start the additional thread
+            track_details = controller.start_new_queue(connection, play_queue, song_id_list[:2])  # When generating the playlist return the first two tracks.
+            start_background_enqueue(song_id_list[2:])  # Enqueue the remaining tracks in the background
 
-            speech = sanitise_speech_output('Playing your favourite tracks.')
+            speech = SPEECH_PLAYING_FAVOURITES
             logger.info(speech)
-            track_details = play_queue.get_next_track()
             card = build_card_data(speech, track_details)
 
             return controller.start_playback('play', speech, card, track_details, handler_input)
 
 
-class NaviSonicRandomiseQueue(AbstractRequestHandler):
+class NaviSonicRandomiseQueue(DispatchedRequestHandler):
     """Handle NaviSonicRandomiseQueue Intent
 
     Shuffle the current play queue
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicRandomiseQueue')(handler_input)
+    intent_names = ('NaviSonicRandomiseQueue',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicRandomiseQueue Handler')
 
-        play_queue.shuffle()
-        play_queue.sync()
+        play_queue.shuffle_and_sync()
 
         return handler_input.response_builder.response
 
 
-class NaviSonicSongDetails(AbstractRequestHandler):
+class NaviSonicSongDetails(DispatchedRequestHandler):
     """Handle NaviSonicSongDetails Intent
 
     Returns information on the track that is currently playing
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicSongDetails')(handler_input)
+    intent_names = ('NaviSonicSongDetails',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicSongDetails Handler')
@@ -945,14 +923,13 @@ class NaviSonicSongDetails(AbstractRequestHandler):
         return handler_input.response_builder.response
 
 
-class NaviSonicStarSong(AbstractRequestHandler):
+class NaviSonicStarSong(DispatchedRequestHandler):
     """Handle NaviSonicStarSong Intent
 
     Star / favourite the current song
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicStarSong')(handler_input)
+    intent_names = ('NaviSonicStarSong',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicStarSong Handler')
@@ -960,20 +937,19 @@ class NaviSonicStarSong(AbstractRequestHandler):
         current_track = play_queue.get_current_track()
 
         song_id = current_track.id
-        source = getattr(current_track, 'source', 'navidrome')
+        source = current_track.source
         connection.star_entry(song_id, 'song', source)
 
         return handler_input.response_builder.response
 
 
-class NaviSonicUnstarSong(AbstractRequestHandler):
+class NaviSonicUnstarSong(DispatchedRequestHandler):
     """Handle NaviSonicUnstarSong Intent
 
     Unstar / remove from favourites the current song
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicUnstarSong')(handler_input)
+    intent_names = ('NaviSonicUnstarSong',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicUnstarSong Handler')
@@ -981,35 +957,34 @@ class NaviSonicUnstarSong(AbstractRequestHandler):
         current_track = play_queue.get_current_track()
 
         song_id = current_track.id
-        source = getattr(current_track, 'source', 'navidrome')
+        source = current_track.source
         connection.unstar_entry(song_id, 'song', source)
 
         return handler_input.response_builder.response
 
 
-class NaviSonicPlaySong(AbstractRequestHandler):
+class NaviSonicPlaySong(DispatchedRequestHandler):
     """Handle NaviSonicPlaySong Intent
 
     Play a song by name (without specifying artist)
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicPlaySong')(handler_input)
+    intent_names = ('NaviSonicPlaySong',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
-        global backgroundProcess
         logger.debug('In NaviSonicPlaySong')
 
-        # Check if a background process is already running, if it is then terminate the process
-        # in favour of the new process.
-        if backgroundProcess is not None:
-            backgroundProcess.terminate()
-            backgroundProcess.join()
+        # Stop any background job still enqueuing a previous playlist
+        stop_background_enqueue()
 
         # Get the requested song
         song = get_slot_value_v2(handler_input, 'song')
 
-        logger.debug(f'Searching for song: {song.value}')
+        logger.debug('Searching for song: %s', song.value)
+
+        # Random songs are used to fill up short search results, fetch them
+        # while the search runs rather than after it
+        random_future = prefetch_random_songs()
 
         # Search for the song
         song_list = connection.search_song(song.value)
@@ -1017,6 +992,7 @@ class NaviSonicPlaySong(AbstractRequestHandler):
         if song_list is None or len(song_list) == 0:
             text = sanitise_speech_output(f"I couldn't find the song {song.value} in the collection.")
             handler_input.response_builder.speak(text).ask(text)
+            cancel_prefetch(random_future)
             return handler_input.response_builder.response
 
         # Get the best match (first result after sorting)
@@ -1025,68 +1001,41 @@ class NaviSonicPlaySong(AbstractRequestHandler):
         song_artist = best_match.get('artist', 'Unknown Artist')
 
         # Build list of song IDs with their sources from search results
-        song_id_list = []
-        search_song_ids = set()  # Track IDs to avoid duplicates
-        for song_item in song_list[:int(min_song_count)]:
-            song_id = song_item.get('id')
-            source = song_item.get('source', 'navidrome')
-            song_id_list.append((song_id, source))
-            search_song_ids.add(song_id)
+        song_id_list = [(song_item.get('id'), song_item.get('source', 'navidrome')) for song_item in song_list[:min_song_count]]
 
         # If we don't have enough songs, fill up with random songs
-        target_count = int(min_song_count)
-        if len(song_id_list) < target_count:
-            remaining_count = target_count - len(song_id_list)
-            logger.debug(f'Search returned {len(song_id_list)} songs, filling remaining {remaining_count} with random songs')
-
-            random_songs = connection.build_random_song_list(remaining_count * 2)  # Request extra to account for duplicates
-            if random_songs:
-                for random_song in random_songs:
-                    if len(song_id_list) >= target_count:
-                        break
-                    # Handle both tuple and non-tuple formats
-                    if isinstance(random_song, tuple):
-                        r_id, r_source = random_song
-                    else:
-                        r_id, r_source = random_song, 'navidrome'
-
-                    # Avoid duplicates
-                    if r_id not in search_song_ids:
-                        song_id_list.append((r_id, r_source))
-                        search_song_ids.add(r_id)
-
-        play_queue.clear()
+        if len(song_id_list) < min_song_count:
+            logger.debug('Search returned %s songs, filling remaining %s with random songs', len(song_id_list), min_song_count - len(song_id_list))
+            random_songs = random_future.result() if random_future else connection.build_random_song_list(min_song_count * 2)
+            song_id_list = fill_song_id_list(song_id_list, random_songs, min_song_count)
+        else:
+            cancel_prefetch(random_future)
 
         # Work around the Amazon / Alexa 8 second timeout.
         # Enqueue first two tracks immediately
-        initial_songs = song_id_list[:2] if len(song_id_list) >= 2 else song_id_list
-        remaining_songs = song_id_list[2:] if len(song_id_list) > 2 else []
+        initial_songs = song_id_list[:2]
+        remaining_songs = song_id_list[2:]
 
-        controller.enqueue_songs(connection, play_queue, initial_songs)
-        if remaining_songs:
-            backgroundProcess = Process(target=queue_worker_thread, args=(connection, play_queue, remaining_songs))
-            backgroundProcess.start()
+        track_details = controller.start_new_queue(connection, play_queue, initial_songs)
+        start_background_enqueue(remaining_songs)  # Enqueue the remaining tracks in the background
 
         # Truncate title/artist for speech to avoid overly long announcements
         speech_title = truncate_for_speech(song_title, max_length=50)
         speech_artist = truncate_for_speech(song_artist, max_length=40)
         speech = sanitise_speech_output(f'Playing {speech_title} by {speech_artist}')
         logger.info(speech)
-        track_details = play_queue.get_next_track()
         card = build_card_data(speech, track_details)
 
         return controller.start_playback('play', speech, card, track_details, handler_input)
 
 
-class NaviSonicLoopOn(AbstractRequestHandler):
+class NaviSonicLoopOn(DispatchedRequestHandler):
     """Handle NaviSonicLoopOn Intent
 
     Enable loop mode for the playlist
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return (is_intent_name('NaviSonicLoopOn')(handler_input) or
-                is_intent_name('AMAZON.LoopOnIntent')(handler_input))
+    intent_names = ('NaviSonicLoopOn', 'AMAZON.LoopOnIntent')
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicLoopOn Handler')
@@ -1094,100 +1043,92 @@ class NaviSonicLoopOn(AbstractRequestHandler):
         play_queue.set_playback_mode('loop')
         play_queue.save_original_queue()
 
-        text = sanitise_speech_output('Loop mode enabled')
+        text = SPEECH_LOOP_ON
         handler_input.response_builder.speak(text)
 
         return handler_input.response_builder.response
 
 
-class NaviSonicLoopOff(AbstractRequestHandler):
+class NaviSonicLoopOff(DispatchedRequestHandler):
     """Handle NaviSonicLoopOff Intent
 
     Disable loop mode
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return (is_intent_name('NaviSonicLoopOff')(handler_input) or
-                is_intent_name('AMAZON.LoopOffIntent')(handler_input))
+    intent_names = ('NaviSonicLoopOff', 'AMAZON.LoopOffIntent')
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicLoopOff Handler')
 
         play_queue.set_playback_mode('normal')
 
-        text = sanitise_speech_output('Loop mode disabled')
+        text = SPEECH_LOOP_OFF
         handler_input.response_builder.speak(text)
 
         return handler_input.response_builder.response
 
 
-class NaviSonicRepeatOn(AbstractRequestHandler):
+class NaviSonicRepeatOn(DispatchedRequestHandler):
     """Handle NaviSonicRepeatOn Intent
 
     Enable repeat one mode (repeat current song)
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return (is_intent_name('NaviSonicRepeatOn')(handler_input) or
-                is_intent_name('AMAZON.RepeatIntent')(handler_input))
+    intent_names = ('NaviSonicRepeatOn', 'AMAZON.RepeatIntent')
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicRepeatOn Handler')
 
         play_queue.set_playback_mode('repeat_one')
 
-        text = sanitise_speech_output('Repeat mode enabled')
+        text = SPEECH_REPEAT_ON
         handler_input.response_builder.speak(text)
 
         return handler_input.response_builder.response
 
 
-class NaviSonicRepeatOff(AbstractRequestHandler):
+class NaviSonicRepeatOff(DispatchedRequestHandler):
     """Handle NaviSonicRepeatOff Intent
 
     Disable repeat mode
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('NaviSonicRepeatOff')(handler_input)
+    intent_names = ('NaviSonicRepeatOff',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicRepeatOff Handler')
 
         play_queue.set_playback_mode('normal')
 
-        text = sanitise_speech_output('Repeat mode disabled')
+        text = SPEECH_REPEAT_OFF
         handler_input.response_builder.speak(text)
 
         return handler_input.response_builder.response
 
 
-class NaviSonicShuffleOn(AbstractRequestHandler):
+class NaviSonicShuffleOn(DispatchedRequestHandler):
     """Handle AMAZON.ShuffleOnIntent
 
     Shuffle the current queue
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('AMAZON.ShuffleOnIntent')(handler_input)
+    intent_names = ('AMAZON.ShuffleOnIntent',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicShuffleOn Handler')
 
-        play_queue.shuffle()
-        play_queue.sync()
+        play_queue.shuffle_and_sync()
 
-        text = sanitise_speech_output('Queue shuffled')
+        text = SPEECH_QUEUE_SHUFFLED
         handler_input.response_builder.speak(text)
 
         return handler_input.response_builder.response
 
 
-class NaviSonicShuffleOff(AbstractRequestHandler):
+class NaviSonicShuffleOff(DispatchedRequestHandler):
     """Handle AMAZON.ShuffleOffIntent"""
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('AMAZON.ShuffleOffIntent')(handler_input)
+    intent_names = ('AMAZON.ShuffleOffIntent',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicShuffleOff Handler')
@@ -1195,14 +1136,13 @@ class NaviSonicShuffleOff(AbstractRequestHandler):
         return handler_input.response_builder.response
 
 
-class NaviSonicStartOver(AbstractRequestHandler):
+class NaviSonicStartOver(DispatchedRequestHandler):
     """Handle AMAZON.StartOverIntent
 
     Restart the current track from the beginning
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('AMAZON.StartOverIntent')(handler_input)
+    intent_names = ('AMAZON.StartOverIntent',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NaviSonicStartOver Handler')
@@ -1217,15 +1157,14 @@ class NaviSonicStartOver(AbstractRequestHandler):
 #
 
 
-class PlaybackStartedHandler(AbstractRequestHandler):
+class PlaybackStartedHandler(DispatchedRequestHandler):
     """AudioPlayer.PlaybackStarted Directive received.
 
     Confirming that the requested audio file began playing.
     Do not send any specific response.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_request_type('AudioPlayer.PlaybackStarted')(handler_input)
+    request_types = ('AudioPlayer.PlaybackStarted',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In PlaybackStartedHandler')
@@ -1234,37 +1173,34 @@ class PlaybackStartedHandler(AbstractRequestHandler):
         return handler_input.response_builder.response
 
 
-class PlaybackStoppedHandler(AbstractRequestHandler):
+class PlaybackStoppedHandler(DispatchedRequestHandler):
     """AudioPlayer.PlaybackStopped Directive received.
 
     Confirming that the requested audio file stopped playing.
     Do not send any specific response.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_request_type('AudioPlayer.PlaybackStopped')(handler_input)
+    request_types = ('AudioPlayer.PlaybackStopped',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In PlaybackStoppedHandler')
 
         # store the current offset for later resumption
-        play_queue.set_current_track_offset(handler_input.request_envelope.request.offset_in_milliseconds)
+        current_track = play_queue.set_current_track_offset(handler_input.request_envelope.request.offset_in_milliseconds)
 
-        current_track = play_queue.get_current_track()
-        logger.debug(f'Stored track offset of: {current_track.offset} ms for {current_track.title}')
+        logger.debug('Stored track offset of: %s ms for %s', current_track.offset, current_track.title)
         logger.info('Playback stopped')
 
         return handler_input.response_builder.response
 
 
-class PlaybackNearlyFinishedHandler(AbstractRequestHandler):
+class PlaybackNearlyFinishedHandler(DispatchedRequestHandler):
     """AudioPlayer.PlaybackNearlyFinished Directive received.
 
     Replacing queue with the URL again. This should not happen on live streams.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_request_type('AudioPlayer.PlaybackNearlyFinished')(handler_input)
+    request_types = ('AudioPlayer.PlaybackNearlyFinished',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In PlaybackNearlyFinishedHandler')
@@ -1274,39 +1210,38 @@ class PlaybackNearlyFinishedHandler(AbstractRequestHandler):
         return controller.start_playback('continue', None, None, track_details, handler_input)
 
 
-class PlaybackFinishedHandler(AbstractRequestHandler):
+class PlaybackFinishedHandler(DispatchedRequestHandler):
     """AudioPlayer.PlaybackFinished Directive received.
 
     Confirming that the requested audio file completed playing.
     Do not send any specific response.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_request_type('AudioPlayer.PlaybackFinished')(handler_input)
+    request_types = ('AudioPlayer.PlaybackFinished',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In PlaybackFinishedHandler')
 
-        # Generate a timestamp in milliseconds for scrobbling
-        timestamp_ms = datetime.now().timestamp()
+        # Generate a UNIX timestamp in seconds for scrobbling, py-sonic converts it to milliseconds
+        timestamp = time.time()
         current_track = play_queue.get_current_track()
-        source = getattr(current_track, 'source', 'navidrome')
-        connection.scrobble(current_track.id, timestamp_ms, source)
+
+        # Nothing in the response depends on the scrobble, don't make Alexa wait for it
+        scrobble = request_executor.submit(connection.scrobble, current_track.id, timestamp, current_track.source)
+        scrobble.add_done_callback(log_background_error)
+
         play_queue.get_next_track()
 
         return handler_input.response_builder.response
 
 
-class PausePlaybackHandler(AbstractRequestHandler):
+class PausePlaybackHandler(DispatchedRequestHandler):
     """Handler for stopping audio.
 
     Handles Stop, Cancel and Pause Intents and PauseCommandIssued event.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return (is_intent_name('AMAZON.StopIntent')(handler_input) or
-                is_intent_name('AMAZON.CancelIntent')(handler_input) or
-                is_intent_name('AMAZON.PauseIntent')(handler_input))
+    intent_names = ('AMAZON.StopIntent', 'AMAZON.CancelIntent', 'AMAZON.PauseIntent')
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In PausePlaybackHandler')
@@ -1315,15 +1250,13 @@ class PausePlaybackHandler(AbstractRequestHandler):
         return controller.stop(handler_input)
 
 
-class ResumePlaybackHandler(AbstractRequestHandler):
+class ResumePlaybackHandler(DispatchedRequestHandler):
     """Handler for resuming audio on different events.
 
     Handles PlayAudio Intent, Resume Intent.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return (is_intent_name('AMAZON.ResumeIntent')(handler_input) or
-                is_intent_name('PlayAudio')(handler_input))
+    intent_names = ('AMAZON.ResumeIntent', 'PlayAudio')
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In ResumePlaybackHandler')
@@ -1332,8 +1265,8 @@ class ResumePlaybackHandler(AbstractRequestHandler):
 
         if current_track.offset > 0:
             # There is a paused track, continue
-            logger.info('Resuming ' + str(current_track.title))
-            logger.info('Offset ' + str(current_track.offset))
+            logger.info('Resuming %s', current_track.title)
+            logger.info('Offset %s', current_track.offset)
 
             return controller.start_playback('play', None, None, current_track, handler_input)
 
@@ -1345,11 +1278,10 @@ class ResumePlaybackHandler(AbstractRequestHandler):
             return controller.start_playback('play', None, None, track_details, handler_input)
 
 
-class NextPlaybackHandler(AbstractRequestHandler):
+class NextPlaybackHandler(DispatchedRequestHandler):
     """Handle NextIntent"""
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('AMAZON.NextIntent')(handler_input)
+    intent_names = ('AMAZON.NextIntent',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In NextPlaybackHandler')
@@ -1362,11 +1294,10 @@ class NextPlaybackHandler(AbstractRequestHandler):
         return controller.start_playback('play', None, None, track_details, handler_input)
 
 
-class PreviousPlaybackHandler(AbstractRequestHandler):
+class PreviousPlaybackHandler(DispatchedRequestHandler):
     """Handle PreviousIntent"""
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_intent_name('AMAZON.PreviousIntent')(handler_input)
+    intent_names = ('AMAZON.PreviousIntent',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In PreviousPlaybackHandler')
@@ -1378,15 +1309,14 @@ class PreviousPlaybackHandler(AbstractRequestHandler):
         return controller.start_playback('play', None, None, track_details, handler_input)
 
 
-class PlaybackControllerNextHandler(AbstractRequestHandler):
+class PlaybackControllerNextHandler(DispatchedRequestHandler):
     """Handle PlaybackController.NextCommandIssued (physical button press)
     
     Note: PlaybackController requests cannot contain outputSpeech, reprompt,
     or shouldEndSession - only audio directives are allowed.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_request_type('PlaybackController.NextCommandIssued')(handler_input)
+    request_types = ('PlaybackController.NextCommandIssued',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In PlaybackControllerNextHandler')
@@ -1398,15 +1328,14 @@ class PlaybackControllerNextHandler(AbstractRequestHandler):
         return controller.start_playback('play', None, None, track_details, handler_input)
 
 
-class PlaybackControllerPreviousHandler(AbstractRequestHandler):
+class PlaybackControllerPreviousHandler(DispatchedRequestHandler):
     """Handle PlaybackController.PreviousCommandIssued (physical button press)
     
     Note: PlaybackController requests cannot contain outputSpeech, reprompt,
     or shouldEndSession - only audio directives are allowed.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_request_type('PlaybackController.PreviousCommandIssued')(handler_input)
+    request_types = ('PlaybackController.PreviousCommandIssued',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In PlaybackControllerPreviousHandler')
@@ -1418,15 +1347,14 @@ class PlaybackControllerPreviousHandler(AbstractRequestHandler):
         return controller.start_playback('play', None, None, track_details, handler_input)
 
 
-class PlaybackControllerPlayHandler(AbstractRequestHandler):
+class PlaybackControllerPlayHandler(DispatchedRequestHandler):
     """Handle PlaybackController.PlayCommandIssued (physical button press)
     
     Note: PlaybackController requests cannot contain outputSpeech, reprompt,
     or shouldEndSession - only audio directives are allowed.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_request_type('PlaybackController.PlayCommandIssued')(handler_input)
+    request_types = ('PlaybackController.PlayCommandIssued',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In PlaybackControllerPlayHandler')
@@ -1445,15 +1373,14 @@ class PlaybackControllerPlayHandler(AbstractRequestHandler):
             return handler_input.response_builder.response
 
 
-class PlaybackControllerPauseHandler(AbstractRequestHandler):
+class PlaybackControllerPauseHandler(DispatchedRequestHandler):
     """Handle PlaybackController.PauseCommandIssued (physical button press)
     
     Note: PlaybackController requests cannot contain outputSpeech, reprompt,
     or shouldEndSession - only audio directives are allowed.
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_request_type('PlaybackController.PauseCommandIssued')(handler_input)
+    request_types = ('PlaybackController.PauseCommandIssued',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In PlaybackControllerPauseHandler')
@@ -1461,7 +1388,7 @@ class PlaybackControllerPauseHandler(AbstractRequestHandler):
         return controller.stop(handler_input)
 
 
-class PlaybackFailedEventHandler(AbstractRequestHandler):
+class PlaybackFailedEventHandler(DispatchedRequestHandler):
     """AudioPlayer.PlaybackFailed Directive received.
 
     Handles playback failures by:
@@ -1469,34 +1396,32 @@ class PlaybackFailedEventHandler(AbstractRequestHandler):
     2. For already transcoded tracks: Skip to the next track
     """
 
-    def can_handle(self, handler_input: HandlerInput) -> bool:
-        return is_request_type('AudioPlayer.PlaybackFailed')(handler_input)
+    request_types = ('AudioPlayer.PlaybackFailed',)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         logger.debug('In PlaybackFailedHandler')
 
         current_track = play_queue.get_current_track()
         song_id = current_track.id
-        source = getattr(current_track, 'source', 'navidrome')
-        transcoded = getattr(current_track, 'transcoded', False)
+        source = current_track.source
+        transcoded = current_track.transcoded
 
         # Log failure and track ID
-        logger.error(f'Playback Failed: {handler_input.request_envelope.request.error}')
-        logger.error(f'Failed playing track with ID: {song_id} from source: {source}')
+        logger.error('Playback Failed: %s', handler_input.request_envelope.request.error)
+        logger.error('Failed playing track with ID: %s from source: %s', song_id, source)
 
         # Check if we can try transcoding (for both Navidrome and Plex, if not already transcoded)
         if not transcoded:
-            logger.info(f'Attempting to play transcoded stream for track: {song_id} from {source}')
+            logger.info('Attempting to play transcoded stream for track: %s from %s', song_id, source)
 
             # Get transcoded URI
             transcoded_uri = connection.get_transcoded_song_uri(song_id, source)
 
             if transcoded_uri:
                 # Update the current track with transcoded URI
-                play_queue.mark_current_track_transcoded(transcoded_uri)
-                track_details = play_queue.get_current_track()
+                track_details = play_queue.mark_current_track_transcoded(transcoded_uri)
 
-                logger.info(f'Playing transcoded track: {track_details.title} by: {track_details.artist}')
+                logger.info('Playing transcoded track: %s by: %s', track_details.title, track_details.artist)
                 return controller.start_playback('play', None, None, track_details, handler_input)
 
         # Already transcoded or transcoding failed - skip to the next track
@@ -1511,6 +1436,46 @@ class PlaybackFailedEventHandler(AbstractRequestHandler):
         return controller.start_playback('play', None, None, track_details, handler_input)
 
 
+class RequestDispatchHandler(AbstractRequestHandler):
+    """Dispatch requests to the handler registered for the intent or request type
+
+    The skill builder asks each registered handler in turn whether it can
+    handle a request.  Routing intents by intent name, and other requests by
+    request type, through dictionaries replaces that scan with a single lookup.
+    """
+
+    def __init__(self, intent_handlers: dict, request_handlers: dict) -> None:
+        """
+        :param dict intent_handlers: A dictionary mapping intent names to request handlers
+        :param dict request_handlers: A dictionary mapping request types to request handlers
+        :return: None
+        """
+
+        self.intent_handlers = intent_handlers
+        self.request_handlers = request_handlers
+
+    def get_handler(self, handler_input: HandlerInput) -> Union[AbstractRequestHandler, None]:
+        """Find the handler registered for a request
+
+        :param HandlerInput handler_input: The Amazon Alexa HandlerInput object
+        :return: The registered handler or None
+        :rtype: AbstractRequestHandler | None
+        """
+
+        request_type = get_request_type(handler_input)
+
+        if request_type == 'IntentRequest':
+            return self.intent_handlers.get(get_intent_name(handler_input))
+
+        return self.request_handlers.get(request_type)
+
+    def can_handle(self, handler_input: HandlerInput) -> bool:
+        return self.get_handler(handler_input) is not None
+
+    def handle(self, handler_input: HandlerInput) -> Response:
+        return self.get_handler(handler_input).handle(handler_input)
+
+
 #
 # Exception Handers
 #
@@ -1524,21 +1489,21 @@ class SystemExceptionHandler(AbstractExceptionHandler):
     """
 
     def can_handle(self, handler_input: HandlerInput, exception: Exception) -> bool:
-        return is_request_type('System.ExceptionEncountered')(handler_input)
+        return IS_SYSTEM_EXCEPTION_ENCOUNTERED(handler_input)
 
     def handle(self, handler_input: HandlerInput, exception: Exception) -> Response:
         logger.debug('In SystemExceptionHandler')
 
         # Log the exception
-        logger.error(f'System Exception: {exception}')
-        logger.error(f'Request Type Was: {get_request_type(handler_input)}')
+        logger.error('System Exception: %s', exception)
+        logger.error('Request Type Was: %s', get_request_type(handler_input))
         error = handler_input.request_envelope.request.to_dict()
-        logger.error(f"Details: {error.get('error').get('message')}")
+        logger.error("Details: %s", error.get('error').get('message'))
 
         if get_request_type(handler_input) == 'IntentRequest':
-            logger.error(f'Intent Name Was: {get_intent_name(handler_input)}')
+            logger.error('Intent Name Was: %s', get_intent_name(handler_input))
 
-        speech = sanitise_speech_output("Sorry, I didn't get that. Can you please say it again!!")
+        speech = SPEECH_ERROR
         handler_input.response_builder.speak(speech).ask(speech)
 
         return handler_input.response_builder.response
@@ -1558,13 +1523,13 @@ class GeneralExceptionHandler(AbstractExceptionHandler):
         logger.debug('In GeneralExceptionHandler')
 
         # Log the exception
-        logger.error(f'General Exception: {exception}')
-        logger.error(f'Request Type Was: {get_request_type(handler_input)}')
+        logger.error('General Exception: %s', exception)
+        logger.error('Request Type Was: %s', get_request_type(handler_input))
 
         if get_request_type(handler_input) == 'IntentRequest':
-            logger.error(f'Intent Name Was: {get_intent_name(handler_input)}')
+            logger.error('Intent Name Was: %s', get_intent_name(handler_input))
 
-        speech = sanitise_speech_output("Sorry, I didn't get that. Can you please say it again!!")
+        speech = SPEECH_ERROR
         handler_input.response_builder.speak(speech).ask(speech)
 
         return handler_input.response_builder.response
@@ -1582,7 +1547,7 @@ class LoggingRequestInterceptor(AbstractRequestInterceptor):
     """
 
     def process(self, handler_input: HandlerInput):
-        logger.debug(f'Request received: {handler_input.request_envelope.request}')
+        logger.debug('Request received: %s', handler_input.request_envelope.request)
 
 
 class LoggingResponseInterceptor(AbstractResponseInterceptor):
@@ -1592,7 +1557,7 @@ class LoggingResponseInterceptor(AbstractResponseInterceptor):
     """
 
     def process(self, handler_input: HandlerInput, response: Response):
-        logger.debug(f'Response sent: {response}')
+        logger.debug('Response sent: %s', response)
 
 #
 # Functions
@@ -1645,6 +1610,98 @@ def truncate_for_speech(text: str, max_length: int = 50) -> str:
     return text
 
 
+def artist_name_matches(normalized_artist: str, clean_search: str, item_artist: str, item_original_artist: str) -> bool:
+    """Check whether a song's artist matches the artist the user asked for
+
+    The artist name from voice may not exactly match (e.g., "huntrix" vs "HUNTR/X")
+    so substring, prefix and fuzzy matches are accepted.
+
+    :param str normalized_artist: The requested artist in lower case
+    :param str clean_search: The requested artist with special characters removed
+    :param str item_artist: The artist of the song
+    :param str item_original_artist: The original artist of the song
+    :return: True if the artist matches
+    :rtype: bool
+    """
+
+    item_artist = item_artist.lower()
+
+    # Check if search term is contained in artist name (substring match)
+    if normalized_artist in item_artist or normalized_artist in item_original_artist.lower():
+        return True
+
+    # Check if artist name starts with or contains key part of search term
+    # Handle cases like "huntrix" matching "HUNTR/X (Ejae, AUDREY NUNA & REI AMI)"
+    # Remove special characters for comparison
+    clean_artist = NON_ALPHANUMERIC_RE.sub('', item_artist)
+
+    if clean_search in clean_artist or clean_artist.startswith(clean_search):
+        return True
+
+    # Fuzzy match as last resort, scored the same way as MediaService._fuzzy_match()
+    similarity = fuzz.ratio(clean_search, clean_artist.split()[0] if clean_artist else '') / 100.0
+
+    return similarity > 0.7
+
+
+def fill_song_id_list(song_id_list: list, random_songs: list, target_count: int) -> list:
+    """Fill up a list of songs with random songs
+
+    Songs are keyed by ID in an insertion ordered dictionary, so duplicates
+    are dropped while the search results keep their order.
+
+    :param list song_id_list: A list of (id, source) tuples
+    :param list random_songs: A list of (id, source) tuples from build_random_song_list(), may be None
+    :param int target_count: The number of songs the list should contain
+    :return: A list of (id, source) tuples
+    :rtype: list
+    """
+
+    songs = {song[0]: song for song in song_id_list}
+
+    for song in random_songs or ():
+        if len(songs) >= target_count:
+            break
+
+        songs.setdefault(song[0], song)
+
+    return list(songs.values())
+
+
+def prefetch_random_songs() -> Union[Future, None]:
+    """Start fetching random songs to fill up a short search result
+
+    The songs are only prefetched when min_song_count is longer than a
+    single page of search results, otherwise a search rarely comes up short
+    and the extra request to the media server would usually be wasted.
+
+    :return: A future for the list of (id, source) tuples, or None if not prefetched
+    :rtype: Future | None
+    """
+
+    if min_song_count <= SEARCH_PAGE_SIZE:
+        return None
+
+    future = request_executor.submit(connection.build_random_song_list, min_song_count * 2)
+    future.add_done_callback(log_background_error)
+
+    return future
+
+
+def cancel_prefetch(future: Union[Future, None]) -> None:
+    """Cancel a random song prefetch that is no longer needed
+
+    A prefetch that has already started runs to completion, its result is
+    simply dropped.
+
+    :param Future future: The future returned by prefetch_random_songs(), may be None
+    :return: None
+    """
+
+    if future is not None:
+        future.cancel()
+
+
 def sanitise_speech_output(speech_string: str) -> str:
     """Sanitise speech output inline with the SSML standard
 
@@ -1659,25 +1716,94 @@ def sanitise_speech_output(speech_string: str) -> str:
 
     logger.debug('In sanitise_speech_output()')
 
-    if '&' in speech_string:
-        speech_string = speech_string.replace('&', 'and')
-    if '/' in speech_string:
-        speech_string = speech_string.replace('/', 'and')
-    if '\\' in speech_string:
-        speech_string = speech_string.replace('\\', 'and')
-    if '"' in speech_string:
-        speech_string = speech_string.replace('"', '')
-    if "'" in speech_string:
-        speech_string = speech_string.replace("'", "")
-    if "<" in speech_string:
-        speech_string = speech_string.replace('<', '')
-    if ">" in speech_string:
-        speech_string = speech_string.replace('>', '')
-
-    return speech_string
-
-
-def queue_worker_thread(connection: object, play_queue: object, song_id_list: list, source: str = 'navidrome') -> None:
+    return speech_string.translate(SSML_TRANSLATION)
+
+
+#
+# Speech for fixed responses, sanitised once at start up
+#
+
+SPEECH_READY = sanitise_speech_output('Ready!')
+SPEECH_HELP = sanitise_speech_output(f'{APP_NAME} lets you interact with media servers that offer a Subsonic compatible A.P.I.')
+SPEECH_NO_SONGS = sanitise_speech_output("I couldn't find any songs in the collection.")
+SPEECH_PLAYING_RANDOM = sanitise_speech_output('Playing random music')
+SPEECH_NO_FAVOURITES = sanitise_speech_output("You don't have any favourite songs in the collection.")
+SPEECH_PLAYING_FAVOURITES = sanitise_speech_output('Playing your favourite tracks.')
+SPEECH_LOOP_ON = sanitise_speech_output('Loop mode enabled')
+SPEECH_LOOP_OFF = sanitise_speech_output('Loop mode disabled')
+SPEECH_REPEAT_ON = sanitise_speech_output('Repeat mode enabled')
+SPEECH_REPEAT_OFF = sanitise_speech_output('Repeat mode disabled')
+SPEECH_QUEUE_SHUFFLED = sanitise_speech_output('Queue shuffled')
+SPEECH_ERROR = sanitise_speech_output("Sorry, I didn't get that. Can you please say it again!!")
+
+
+def log_background_error(future: Future) -> None:
+    """Log the exception raised by a background task, if any
+
+    Executors keep exceptions in the future, without this callback errors
+    from tasks whose result is never read would go unnoticed.
+
+    :param Future future: The completed future
+    :return: None
+    """
+
+    if future.cancelled():
+        return
+
+    exception = future.exception()
+
+    if exception is not None:
+        logger.error('Background task failed: %s', exception)
+
+
+def stop_background_enqueue() -> None:
+    """Stop the background job populating the play queue
+
+    The job is only told to stop, it isn't waited for so the request isn't
+    held up by song lookups still in flight.  It skips songs it hasn't looked
+    up yet, and the queue rejects tracks from a job started before it was
+    last cleared, so it can't add tracks to a queue that has since been
+    replaced.
+
+    :return: None
+    """
+
+    global enqueue_job
+
+    with enqueue_lock:
+        if enqueue_job is not None:
+            enqueue_cancel.set()
+            enqueue_job = None
+
+
+def start_background_enqueue(song_id_list: list, source: str = 'navidrome') -> None:
+    """Populate the play queue on the background worker thread
+
+    If another play request has started a job since this request stopped the
+    previous one, that job is cancelled so only the latest job adds tracks.
+
+    :param list song_id_list: A list containing song IDs (or (id, source) tuples)
+    :param str source: Default source for the songs
+    :return: None
+    """
+
+    global enqueue_job, enqueue_cancel
+
+    if not song_id_list:
+        # Nothing left to enqueue, don't submit a job
+        return
+
+    with enqueue_lock:
+        # The single worker runs jobs in order, a cancelled job skips its
+        # remaining songs so there is no need to wait for it here
+        enqueue_cancel.set()
+
+        enqueue_cancel = threading.Event()
+        enqueue_job = enqueue_executor.submit(queue_worker_thread, connection, play_queue, song_id_list, source, enqueue_cancel)
+
+
+def queue_worker_thread(connection: object, play_queue: object, song_id_list: list, source: str = 'navidrome',
+                        cancel: threading.Event = None) -> None:
     """Media queue worker
 
     This function allows media queues to be populated in the background enabling multithreading
@@ -1691,58 +1817,75 @@ def queue_worker_thread(connection: object, play_queue: object, song_id_list: li
     :type song_id_list: list
     :param source: Default source for the songs
     :type source: str
+    :param cancel: Event which stops the worker once set
+    :type cancel: threading.Event
     """
 
     logger.debug('In playlist processing thread!')
-    controller.enqueue_songs(connection, play_queue, song_id_list, source)
-    play_queue.sync()
+
+    try:
+        if not controller.enqueue_songs(connection, play_queue, song_id_list, source, cancel):
+            logger.debug('Playlist processing cancelled')
+            return
+
+        play_queue.sync()
+    except Exception:
+        # Exceptions are not reported by the executor, log them here
+        logger.exception('Error while processing the playlist')
+        return
+
     logger.debug('Finished playlist processing!')
 
 
-# Register Intent Handlers
+# Handlers routed by RequestDispatchHandler, each one declares the intent names and
+# request types it handles
+DISPATCHED_HANDLERS = [
+    HelpHandler(),
+    FallbackIntentHandler(),
+    NaviSonicPlayMusicByArtist(),
+    NaviSonicPlayAlbumByArtist(),
+    NaviSonicPlaySongByArtist(),
+    NaviSonicPlaySongFromAlbum(),
+    NaviSonicPlaySong(),
+    NaviSonicPlayPlaylist(),
+    NaviSonicShufflePlaylist(),
+    NaviSonicPlayFavouriteSongs(),
+    NaviSonicPlayMusicByGenre(),
+    NaviSonicPlayMusicRandom(),
+    NaviSonicRandomiseQueue(),
+    NaviSonicSongDetails(),
+    NaviSonicStarSong(),
+    NaviSonicUnstarSong(),
+    NaviSonicLoopOn(),
+    NaviSonicLoopOff(),
+    NaviSonicRepeatOn(),
+    NaviSonicRepeatOff(),
+    NaviSonicShuffleOn(),
+    NaviSonicShuffleOff(),
+    NaviSonicStartOver(),
+    PausePlaybackHandler(),
+    ResumePlaybackHandler(),
+    NextPlaybackHandler(),
+    PreviousPlaybackHandler(),
+    PlaybackStartedHandler(),
+    PlaybackStoppedHandler(),
+    PlaybackNearlyFinishedHandler(),
+    PlaybackFinishedHandler(),
+    PlaybackFailedEventHandler(),
+    PlaybackControllerNextHandler(),
+    PlaybackControllerPreviousHandler(),
+    PlaybackControllerPlayHandler(),
+    PlaybackControllerPauseHandler()
+]
+
+INTENT_HANDLERS = {intent_name: handler for handler in DISPATCHED_HANDLERS for intent_name in handler.intent_names}
+REQUEST_HANDLERS = {request_type: handler for handler in DISPATCHED_HANDLERS for request_type in handler.request_types}
+
+# Register Request Handlers
 sb.add_request_handler(LaunchRequestHandler())
 sb.add_request_handler(CheckAudioInterfaceHandler())
 sb.add_request_handler(SkillEventHandler())
-sb.add_request_handler(HelpHandler())
-sb.add_request_handler(FallbackIntentHandler())
-sb.add_request_handler(NaviSonicPlayMusicByArtist())
-sb.add_request_handler(NaviSonicPlayAlbumByArtist())
-sb.add_request_handler(NaviSonicPlaySongByArtist())
-sb.add_request_handler(NaviSonicPlaySongFromAlbum())
-sb.add_request_handler(NaviSonicPlaySong())
-sb.add_request_handler(NaviSonicPlayPlaylist())
-sb.add_request_handler(NaviSonicShufflePlaylist())
-sb.add_request_handler(NaviSonicPlayFavouriteSongs())
-sb.add_request_handler(NaviSonicPlayMusicByGenre())
-sb.add_request_handler(NaviSonicPlayMusicRandom())
-sb.add_request_handler(NaviSonicRandomiseQueue())
-sb.add_request_handler(NaviSonicSongDetails())
-sb.add_request_handler(NaviSonicStarSong())
-sb.add_request_handler(NaviSonicUnstarSong())
-sb.add_request_handler(NaviSonicLoopOn())
-sb.add_request_handler(NaviSonicLoopOff())
-sb.add_request_handler(NaviSonicRepeatOn())
-sb.add_request_handler(NaviSonicRepeatOff())
-sb.add_request_handler(NaviSonicShuffleOn())
-sb.add_request_handler(NaviSonicShuffleOff())
-sb.add_request_handler(NaviSonicStartOver())
-
-# Register AutoPlayer Handlers
-sb.add_request_handler(PlaybackStartedHandler())
-sb.add_request_handler(PlaybackStoppedHandler())
-sb.add_request_handler(PlaybackNearlyFinishedHandler())
-sb.add_request_handler(PlaybackFinishedHandler())
-sb.add_request_handler(PausePlaybackHandler())
-sb.add_request_handler(NextPlaybackHandler())
-sb.add_request_handler(PreviousPlaybackHandler())
-sb.add_request_handler(ResumePlaybackHandler())
-sb.add_request_handler(PlaybackFailedEventHandler())
-
-# Register PlaybackController Handlers (physical button presses)
-sb.add_request_handler(PlaybackControllerNextHandler())
-sb.add_request_handler(PlaybackControllerPreviousHandler())
-sb.add_request_handler(PlaybackControllerPlayHandler())
-sb.add_request_handler(PlaybackControllerPauseHandler())
+sb.add_request_handler(RequestDispatchHandler(INTENT_HANDLERS, REQUEST_HANDLERS))
 
 
 # Register Exception Handlers
@@ -1759,9 +1902,46 @@ sa.register(app=app, route='/')
 
 # Enable queue and history diagnostics
 if navidrome_log_level == 3:
-    logger.warning(f'{APP_NAME} debugging has been enabled, this should only be used when testing!')
+    logger.warning('%s debugging has been enabled, this should only be used when testing!', APP_NAME)
     logger.warning('The /buffer, /queue and /history http endpoints are available publicly!')
 
+    # Number of tracks shown on a debug page unless a limit is given
+    DEBUG_PAGE_SIZE = 100
+
+    def view_tracks(title: str, name: str):
+        """Create a tabulated page containing part of a play_queue deque
+
+        The tracks shown can be selected with the offset and limit query
+        parameters.  The response carries an ETag so a refresh of an
+        unchanged page is answered with 304 Not Modified.
+
+        :param str title: The page title
+        :param str name: The deque to show, 'queue', 'history' or 'buffer'
+        :return: A Flask response
+        """
+
+        # Negative values would make islice() raise, clamp them to 0
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        limit = max(request.args.get('limit', DEBUG_PAGE_SIZE, type=int), 0)
+
+        current_track = play_queue.get_current_track()
+        tracks = play_queue.get_tracks(name, offset, limit)
+
+        etag = hashlib.blake2b(
+            '\n'.join([str(current_track.id), str(offset)] + [str(track.id) for track in tracks]).encode(),
+            digest_size=8
+        ).hexdigest()
+
+        if etag in request.if_none_match:
+            response = app.response_class(status=304)
+        else:
+            response = app.response_class(stream_template('table.html', title=title, tracks=tracks, current=current_track))
+
+        response.set_etag(etag)
+        response.cache_control.max_age = 5
+
+        return response
+
     @app.route('/queue')
     def view_queue():
         """View the contents of play_queue.queue
@@ -1769,10 +1949,7 @@ if navidrome_log_level == 3:
         Creates a tabulated page containing the contents of the play_queue.queue deque.
         """
 
-        current_track = play_queue.get_current_track()
-
-        return render_template('table.html', title=f'{APP_NAME} - Queued Tracks',
-                               tracks=play_queue.get_current_queue(), current=current_track)
+        return view_tracks(f'{APP_NAME} - Queued Tracks', 'queue')
 
     @app.route('/history')
     def view_history():
@@ -1781,10 +1958,7 @@ if navidrome_log_level == 3:
         Creates a tabulated page containing the contents of the play_queue.history deque.
         """
 
-        current_track = play_queue.get_current_track()
-
-        return render_template('table.html', title=f'{APP_NAME} - Track History',
-                               tracks=play_queue.get_history(), current=current_track)
+        return view_tracks(f'{APP_NAME} - Track History', 'history')
 
     @app.route('/buffer')
     def view_buffer():
@@ -1793,13 +1967,12 @@ if navidrome_log_level == 3:
         Creates a tabulated page containing the contents of the play_queue.buffer deque.
         """
 
-        current_track = play_queue.get_current_track()
-
-        return render_template('table.html', title=f'{APP_NAME} - Buffered Tracks',
-                               tracks=play_queue.get_buffer(), current=current_track)
+        return view_tracks(f'{APP_NAME} - Buffered Tracks', 'buffer')
 
 
 # Run web app by default when file is executed.
 if __name__ == '__main__':
-    # Start the web service
-    app.run(host='0.0.0.0')
+    # Start the web service.  Requests are served by a pool of threads in a
+    # single process, the play queue and background enqueue worker are
+    # process wide so the service must not be run with multiple workers.
+    serve(app, host='0.0.0.0', port=5000, threads=8)
@@ -1,5 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import inspect
 import logging
 import os
+from threading import Event
 from typing import Union
 
 from ask_sdk_core.handler_input import HandlerInput
@@ -22,11 +26,41 @@ APP_NAME = os.getenv('SKILL_NAME', 'AskNavidromePlex')
 # Default fallback image URL
 DEFAULT_ART_URL = 'https://github.com/navidrome/navidrome/raw/master/resources/logo-192x192.png'
 
+# Number of tracks sent to the (BaseManager proxied) MediaQueue per call when enqueuing
+ENQUEUE_BATCH_SIZE = 16
+
+# Maximum number of songs looked up in parallel when building tracks
+MAX_PARALLEL_LOOKUPS = 8
+
 #
 # Helper Functions
 #
 
 
+@lru_cache(maxsize=512)
+def build_image(url: str, description: str) -> display.Image:
+    """Build a display Image for a single URL
+
+    Tracks of the same album share their art, so Image objects are cached
+    and shared between responses.  They are only read when the response is
+    serialised.
+
+    :param str url: URL of the image
+    :param str description: Content description of the image
+    :return: An Amazon display Image object
+    :rtype: display.Image
+    """
+
+    return display.Image(
+        content_description=description,
+        sources=[
+            display.ImageInstance(
+                url=url
+            )
+        ]
+    )
+
+
 def build_metadata_from_track(track_details: Track) -> Union[AudioItemMetadata, None]:
     """Build AudioItemMetadata directly from Track object.
 
@@ -42,36 +76,26 @@ def build_metadata_from_track(track_details: Track) -> Union[AudioItemMetadata,
 
     logger.debug('In build_metadata_from_track()')
 
-    art_url = getattr(track_details, 'cover_art_url', None) or DEFAULT_ART_URL
-    background_url = getattr(track_details, 'background_url', None) or DEFAULT_ART_URL
-    title = getattr(track_details, 'title', '') or 'Unknown Track'
-    artist = getattr(track_details, 'artist', '') or 'Unknown Artist'
-    album = getattr(track_details, 'album', '') or ''
+    art_url = track_details.cover_art_url or DEFAULT_ART_URL
+    background_url = track_details.background_url or DEFAULT_ART_URL
+    title = track_details.title or 'Unknown Track'
+    artist = track_details.artist or 'Unknown Artist'
+    album = track_details.album or ''
 
     # Build subtitle with artist and album info
     subtitle = artist
     if album:
         subtitle = f"{artist} • {album}"
 
+    # The images show the album, describing them by album rather than track
+    # title lets every track of an album reuse the same cached Image objects
+    image_description = album or title
+
     metadata = AudioItemMetadata(
         title=title,
         subtitle=subtitle,
-        art=display.Image(
-            content_description=title,
-            sources=[
-                display.ImageInstance(
-                    url=art_url
-                )
-            ]
-        ),
-        background_image=display.Image(
-            content_description=title,
-            sources=[
-                display.ImageInstance(
-                    url=background_url
-                )
-            ]
-        )
+        art=build_image(art_url, image_description),
+        background_image=build_image(background_url, image_description)
     )
 
     return metadata
@@ -93,26 +117,13 @@ def add_screen_background(card_data: dict) -> Union[AudioItemMetadata, None]:
         # Use cover art URL from card_data if available, otherwise use default
         art_url = card_data.get('art_url') or DEFAULT_ART_URL
         background_url = card_data.get('background_url') or DEFAULT_ART_URL
-        
+        title = card_data.get('title', APP_NAME)
+
         metadata = AudioItemMetadata(
-            title=card_data.get('title', APP_NAME),
+            title=title,
             subtitle=card_data.get('text', ''),
-            art=display.Image(
-                content_description=card_data.get('title', APP_NAME),
-                sources=[
-                    display.ImageInstance(
-                        url=art_url
-                    )
-                ]
-            ),
-            background_image=display.Image(
-                content_description=card_data.get('title', APP_NAME),
-                sources=[
-                    display.ImageInstance(
-                        url=background_url
-                    )
-                ]
-            )
+            art=build_image(art_url, title),
+            background_image=build_image(background_url, title)
         )
 
         return metadata
@@ -164,7 +175,7 @@ def start_playback(mode: str, text: str, card_data: dict, track_details: Track,
         if card_data and text:
             # Get art URL from card_data with fallback to default
             art_url = card_data.get('art_url') or DEFAULT_ART_URL
-            
+
             handler_input.response_builder.set_card(
                 StandardCard(
                     title=card_data.get('title', APP_NAME),
@@ -176,51 +187,49 @@ def start_playback(mode: str, text: str, card_data: dict, track_details: Track,
                 )
             )
 
-        handler_input.response_builder.add_directive(
-            PlayDirective(
-                play_behavior=PlayBehavior.REPLACE_ALL,
-                audio_item=AudioItem(
-                    stream=Stream(
-                        token=track_details.id,
-                        url=track_details.uri,
-                        offset_in_milliseconds=track_details.offset,
-                        expected_previous_token=None),
-                    metadata=metadata
-                )
-            )
-        ).set_should_end_session(True)
-
-        if text:
-            # Text is not supported if we are continuing an existing play list
-            handler_input.response_builder.speak(text)
-
-        logger.debug(f'Track ID: {track_details.id}')
-        logger.debug(f'Track Previous ID: {track_details.previous_id}')
-        logger.info(f'Playing track: {track_details.title} by: {track_details.artist}')
+        play_behavior = PlayBehavior.REPLACE_ALL
+        offset = track_details.offset
+        expected_previous_token = None
 
     elif mode == 'continue':
         # Continuing Playback
         logger.debug('In start_playback() - continue mode')
 
-        handler_input.response_builder.add_directive(
-            PlayDirective(
-                play_behavior=PlayBehavior.ENQUEUE,
-                audio_item=AudioItem(
-                    stream=Stream(
-                        token=track_details.id,
-                        url=track_details.uri,
-                        # Offset is 0 to allow playing of the next track from the beginning
-                        # if the Previous intent is used
-                        offset_in_milliseconds=0,
-                        expected_previous_token=track_details.previous_id),
-                    metadata=None
-                )
+        metadata = None
+        play_behavior = PlayBehavior.ENQUEUE
+        # Offset is 0 to allow playing of the next track from the beginning
+        # if the Previous intent is used
+        offset = 0
+        expected_previous_token = track_details.previous_id
+
+    else:
+        return handler_input.response_builder.response
+
+    handler_input.response_builder.add_directive(
+        PlayDirective(
+            play_behavior=play_behavior,
+            audio_item=AudioItem(
+                stream=Stream(
+                    token=track_details.id,
+                    url=track_details.uri,
+                    offset_in_milliseconds=offset,
+                    expected_previous_token=expected_previous_token),
+                metadata=metadata
             )
-        ).set_should_end_session(True)
+        )
+    ).set_should_end_session(True)
 
-        logger.debug(f'Track ID: {track_details.id}')
-        logger.debug(f'Track Previous ID: {track_details.previous_id}')
-        logger.info(f'Enqueuing track: {track_details.title} by: {track_details.artist}')
+    if mode == 'play':
+        if text:
+            # Text is not supported if we are continuing an existing play list
+            handler_input.response_builder.speak(text)
+
+        logger.info('Playing track: %s by: %s', track_details.title, track_details.artist)
+    else:
+        logger.info('Enqueuing track: %s by: %s', track_details.title, track_details.artist)
+
+    logger.debug('Track ID: %s', track_details.id)
+    logger.debug('Track Previous ID: %s', track_details.previous_id)
 
     return handler_input.response_builder.response
 
@@ -239,7 +248,86 @@ def stop(handler_input: HandlerInput) -> Response:
     return handler_input.response_builder.response
 
 
-def enqueue_songs(api, queue: MediaQueue, song_id_list: list, source: str = 'navidrome') -> None:
+def song_lookups(api) -> tuple:
+    """Get the song detail and URI lookup functions for an API object
+
+    A MediaService takes the song source as a second argument while a single
+    SubsonicConnection or PlexConnection only takes the song ID.  This is
+    worked out once, rather than for every song that is looked up.
+
+    :param api: A MediaService, SubsonicConnection or PlexConnection object
+    :return: get_details(song_id, source) and get_uri(song_id, source) functions
+    :rtype: tuple
+    """
+
+    if 'source' in inspect.signature(api.get_song_details).parameters:
+        return api.get_song_details, api.get_song_uri
+
+    return (lambda song_id, song_source: api.get_song_details(song_id),
+            lambda song_id, song_source: api.get_song_uri(song_id))
+
+
+def build_track(api, item, source: str = 'navidrome', lookups: tuple = None) -> Track:
+    """Build a Track object for a song
+
+    :param api: A SubsonicConnection or PlexConnection object to allow access to the API
+    :param item: A song ID or an (id, source) tuple
+    :param str source: Default source if item is a plain ID
+    :param tuple lookups: Result of song_lookups(api), worked out here if not given
+    :return: A Track object for the song
+    :rtype: Track
+    """
+
+    # Handle both plain IDs and (id, source) tuples
+    if isinstance(item, tuple):
+        song_id, song_source = item
+    else:
+        song_id = item
+        song_source = source
+
+    get_details, get_uri = lookups or song_lookups(api)
+
+    song_details = get_details(song_id, song_source)
+    song_uri = get_uri(song_id, song_source)
+
+    return Track.from_song_data(song_details.get('song', {}), song_uri, song_source)
+
+
+def build_tracks(api, items: list, source: str = 'navidrome', executor: ThreadPoolExecutor = None,
+                 cancel: Event = None) -> list:
+    """Build Track objects for several songs
+
+    The song lookups are independent HTTP requests so they are made in
+    parallel, the returned list is in the same order as items.
+
+    :param api: A SubsonicConnection or PlexConnection object to allow access to the API
+    :param list items: A list of song IDs or (id, source) tuples
+    :param str source: Default source if items contains plain IDs
+    :param ThreadPoolExecutor executor: Executor to use, a temporary one is created if not given
+    :param Event cancel: Optional event, once set songs not yet looked up are skipped and None is returned in their place
+    :return: A list of Track objects
+    :rtype: list
+    """
+
+    lookups = song_lookups(api)
+
+    def lookup(item) -> Union[Track, None]:
+        if cancel is not None and cancel.is_set():
+            return None
+
+        return build_track(api, item, source, lookups)
+
+    if len(items) < 2:
+        return [lookup(item) for item in items]
+
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=min(len(items), MAX_PARALLEL_LOOKUPS)) as executor:
+            return list(executor.map(lookup, items))
+
+    return list(executor.map(lookup, items))
+
+
+def enqueue_songs(api, queue: MediaQueue, song_id_list: list, source: str = 'navidrome', cancel: Event = None) -> bool:
     """Enqueue songs
 
     Add Track objects to the queue deque
@@ -248,42 +336,49 @@ def enqueue_songs(api, queue: MediaQueue, song_id_list: list, source: str = 'nav
     :param MediaQueue queue: A MediaQueue object
     :param list song_id_list: A list of song IDs to enqueue (can be IDs or (id, source) tuples)
     :param str source: Default source if song_id_list contains plain IDs
-    :return: None
+    :param Event cancel: Optional event, once set no more songs are looked up or enqueued
+    :return: False if enqueuing was cancelled or the queue was cleared, otherwise True
+    :rtype: bool
     """
 
-    for item in song_id_list:
-        # Handle both plain IDs and (id, source) tuples
-        if isinstance(item, tuple):
-            song_id, song_source = item
-        else:
-            song_id = item
-            song_source = source
-
-        song_details = api.get_song_details(song_id, song_source) if hasattr(api, 'get_song_details') else api.get_song_details(song_id)
-        song_uri = api.get_song_uri(song_id, song_source) if hasattr(api, 'get_song_uri') else api.get_song_uri(song_id)
-
-        song_data = song_details.get('song', {})
-
-        # Create track object from song details with poster URLs
-        new_track = Track(
-            id=song_data.get('id'),
-            title=song_data.get('title'),
-            artist=song_data.get('artist'),
-            artist_id=song_data.get('artistId'),
-            album=song_data.get('album'),
-            album_id=song_data.get('albumId'),
-            track_no=song_data.get('track'),
-            year=song_data.get('year'),
-            genre=song_data.get('genre', ''),
-            duration=song_data.get('duration'),
-            bitrate=song_data.get('bitRate'),
-            uri=song_uri,
-            offset=0,
-            previous_id=None,
-            source=song_source,
-            cover_art_url=song_data.get('coverPosterUrl', ''),
-            background_url=song_data.get('backgroundUrl', '')
-        )
+    # Read the generation before checking for cancellation, whoever clears the
+    # queue cancels this job first, so tracks are never added to a newer queue
+    generation = queue.get_generation()
+
+    # Tracks are looked up in parallel and handed to the queue in batches,
+    # each proxy call is a round trip to the manager process
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_LOOKUPS) as executor:
+        for start in range(0, len(song_id_list), ENQUEUE_BATCH_SIZE):
+            if cancel is not None and cancel.is_set():
+                return False
+
+            batch = build_tracks(api, song_id_list[start:start + ENQUEUE_BATCH_SIZE], source, executor, cancel)
+
+            if cancel is not None and cancel.is_set():
+                return False
+
+            if not queue.add_tracks(batch, generation):
+                return False
+
+    return True
+
+
+def start_new_queue(api, queue: MediaQueue, song_id_list: list, source: str = 'navidrome', shuffle: bool = False) -> Track:
+    """Replace the queue with the given songs and return the first track to play
+
+    The queue is cleared, filled, optionally shuffled and advanced in a single
+    MediaQueue call so the synchronous part of a play intent only makes one
+    round trip to the queue manager.
+
+    :param api: A SubsonicConnection or PlexConnection object to allow access to the API
+    :param MediaQueue queue: A MediaQueue object
+    :param list song_id_list: A list of song IDs to enqueue (can be IDs or (id, source) tuples)
+    :param str source: Default source if song_id_list contains plain IDs
+    :param bool shuffle: Shuffle the songs before picking the first track
+    :return: The track to start playing
+    :rtype: Track
+    """
+
+    tracks = build_tracks(api, song_id_list, source)
 
-        # Add track object to queue
-        queue.add_track(new_track)
+    return queue.replace_queue(tracks, shuffle)
@@ -1,7 +1,9 @@
 from collections import deque
-from copy import deepcopy
+from copy import copy
+from itertools import islice
 import logging
 import random
+from typing import Union
 
 from .track import Track
 
@@ -18,6 +20,9 @@ class MediaQueue:
     MODE_REPEAT_ONE = 'repeat_one'
     MODE_LOOP = 'loop'
 
+    # Number of played tracks kept for the previous intent, older ones are dropped
+    HISTORY_LENGTH = 200
+
     def __init__(self) -> None:
         """
         :return: None
@@ -29,8 +34,8 @@ class MediaQueue:
         self.queue: deque = deque()
         """Deque containing tracks still to be played"""
 
-        self.history: deque = deque()
-        """Deque to hold tracks that have already been played"""
+        self.history: deque = deque(maxlen=self.HISTORY_LENGTH)
+        """Deque to hold tracks that have already been played, bounded so long sessions do not grow without limit"""
 
         self.buffer: deque = deque()
         """Deque to contain the list of tracks to be enqueued
@@ -51,6 +56,9 @@ class MediaQueue:
         self.original_queue: deque = deque()
         """Original queue for loop mode"""
 
+        self.generation: int = 0
+        """Incremented whenever the queue is cleared, so tracks from jobs filling an older queue can be rejected"""
+
     def get_current_track(self) -> Track:
         """Method to return current_track attribute
 
@@ -63,7 +71,7 @@ class MediaQueue:
         """
         return self.current_track
 
-    def set_current_track_offset(self, offset: int) -> None:
+    def set_current_track_offset(self, offset: int) -> Track:
         """Method to set the offset of the current track in milliseconds
 
         Set the offset for the current track in milliseconds.  This is used
@@ -72,10 +80,14 @@ class MediaQueue:
 
         :param offset: The track offset in milliseconds
         :type offset: int
+        :return: The updated current track, saving a separate get_current_track() call
+        :rtype: Track
         """
 
         self.current_track.offset = offset
 
+        return self.current_track
+
     def get_current_queue(self) -> deque:
         """Get the current queue
 
@@ -109,6 +121,24 @@ class MediaQueue:
 
         return self.history
 
+    def get_tracks(self, name: str, offset: int = 0, limit: Union[int, None] = None) -> list:
+        """Get a slice of the queue, history or buffer
+
+        Only the requested tracks are returned, which keeps the transfer
+        small when the deque is shared through BaseManager.
+
+        :param str name: The deque to read, 'queue', 'history' or 'buffer'
+        :param int offset: Index of the first track to return
+        :param int limit: Maximum number of tracks to return, None for all
+        :return: A list of Track objects
+        :rtype: list
+        """
+
+        tracks = {'queue': self.queue, 'history': self.history, 'buffer': self.buffer}[name]
+        stop = None if limit is None else offset + limit
+
+        return list(islice(tracks, offset, stop))
+
     def add_track(self, track: Track) -> None:
         """Add tracks to the queue
 
@@ -118,25 +148,74 @@ class MediaQueue:
 
         self.logger.debug('In add_track()')
 
-        if not self.queue:
-            # This is the first track in the queue
-            self.queue.append(track)
-        else:
-            # There are already tracks in the queue, ensure previous_id is set
+        if self.queue:
+            # There are already tracks in the queue, link to the last one
+            track.previous_id = self.queue[-1].id
 
-            # Get the last track from the deque
-            prev_track = self.queue.pop()
+        self.queue.append(track)
 
-            # Set the previous_id attribute
-            track.previous_id = prev_track.id
+        self.logger.debug('In add_track() - there are %s tracks in the queue', len(self.queue))
+
+    def get_generation(self) -> int:
+        """Get the queue generation
+
+        :return: A number which changes whenever the queue is cleared
+        :rtype: int
+        """
+
+        return self.generation
+
+    def add_tracks(self, tracks: list, generation: Union[int, None] = None) -> bool:
+        """Add several tracks to the queue in one call
+
+        When the queue is shared through BaseManager every method call is a
+        pickled round trip to the manager process, so adding a batch of tracks
+        at once is much cheaper than calling add_track() for each of them.
+
+        :param list tracks: A list of Track objects to be played
+        :param int generation: If given, the tracks are only added while get_generation() still returns this value
+        :return: False if the tracks were rejected because the queue has since been cleared, otherwise True
+        :rtype: bool
+        """
+
+        if generation is not None and generation != self.generation:
+            self.logger.debug('In add_tracks() - rejecting %s tracks for an older queue', len(tracks))
+            return False
 
-            # Return the previous track to the deque
-            self.queue.append(prev_track)
+        self.logger.debug('In add_tracks() - adding %s tracks', len(tracks))
+
+        previous_id = self.queue[-1].id if self.queue else None
+
+        for track in tracks:
+            if previous_id is not None:
+                track.previous_id = previous_id
 
-            # Add the new track to the deque
             self.queue.append(track)
+            previous_id = track.id
+
+        return True
+
+    def replace_queue(self, tracks: list, shuffle: bool = False) -> Track:
+        """Replace the queue with new tracks and get the first one
+
+        Combines clear(), add_tracks(), shuffle() and get_next_track() so a
+        new playlist can be started with a single BaseManager round trip.
+
+        :param list tracks: A list of Track objects to be played
+        :param bool shuffle: Shuffle the tracks before getting the first one
+        :return: The first track to be played
+        :rtype: Track
+        """
+
+        self.logger.debug('In replace_queue()')
 
-        self.logger.debug(f'In add_track() - there are {len(self.queue)} tracks in the queue')
+        self.clear()
+        self.add_tracks(tracks)
+
+        if shuffle:
+            self.shuffle()
+
+        return self.get_next_track()
 
     def shuffle(self) -> None:
         """Shuffle the queue
@@ -148,32 +227,31 @@ class MediaQueue:
 
         self.logger.debug('In shuffle()')
 
-        # Copy the original queue
-        orig = self.queue
-        new_queue = deque()
+        # Copy the original queue into a list, random.shuffle() indexes every
+        # position and indexing into the middle of a deque is O(n)
+        tracks = list(self.queue)
 
         # Randomise the queue
-        random.shuffle(orig)
+        random.shuffle(tracks)
+
+        # Link each track to the one before it, the first track keeps its previous_id
+        for prev_track, track in zip(tracks, islice(tracks, 1, None)):
+            track.previous_id = prev_track.id
 
-        track_id = None
+        # Replace the original queue with the new shuffled one
+        self.queue = deque(tracks)
 
-        for t in orig:
-            if not new_queue:
-                # This is the first track, get the ID and add it
-                track_id = t.id
-                new_queue.append(t)
-            else:
-                # Set the tracks previous_id
-                t.previous_id = track_id
+    def shuffle_and_sync(self) -> None:
+        """Shuffle the queue and synchronise the buffer with it
 
-                # Get the track ID to use as the next previous_id
-                track_id = t.id
+        Equivalent to shuffle() followed by sync(), but a single call when
+        the queue is shared through BaseManager.
 
-                # Add the track to the queue
-                new_queue.append(t)
+        :return: None
+        """
 
-        # Replace the original queue with the new shuffled one
-        self.queue = new_queue
+        self.shuffle()
+        self.sync()
 
     def get_next_track(self) -> Track:
         """Get the next track
@@ -197,10 +275,11 @@ class MediaQueue:
             # Handle loop mode - restore original queue
             if self.playback_mode == self.MODE_LOOP and len(self.original_queue) > 0:
                 self.logger.debug('Loop mode: restoring original queue')
-                # Filter out tracks that have previously failed, then deep-copy
+                # Filter out tracks that have previously failed, then copy.  Track
+                # attributes are all immutable values so a shallow copy is enough
                 self.queue = deque(
-                    deepcopy(track) for track in self.original_queue
-                    if not getattr(track, "playback_failed", False)
+                    copy(track) for track in self.original_queue
+                    if not track.playback_failed
                 )
                 self.history.clear()
             else:
@@ -276,6 +355,7 @@ class MediaQueue:
         self.original_queue.clear()
         self.playback_mode = self.MODE_NORMAL
         self.current_track = Track()
+        self.generation += 1
 
     def get_queue_count(self) -> int:
         """Get the number of tracks in the queue
@@ -306,10 +386,13 @@ class MediaQueue:
         the correct.  In practice this will have already
         queued and there for missing from the current buffer
 
+        The buffer is only ever popped from, so a shallow copy sharing the
+        Track objects with the queue is enough.
+
         :return: None
         """
 
-        self.buffer = deepcopy(self.queue)
+        self.buffer = self.queue.copy()
 
     def set_playback_mode(self, mode: str) -> None:
         """Set the playback mode
@@ -317,14 +400,15 @@ class MediaQueue:
         :param str mode: 'normal', 'repeat_one', or 'loop'
         :return: None
         """
-        self.logger.debug(f'Setting playback mode to: {mode}')
+        self.logger.debug('Setting playback mode to: %s', mode)
         if mode in [self.MODE_NORMAL, self.MODE_REPEAT_ONE, self.MODE_LOOP]:
             self.playback_mode = mode
             if mode == self.MODE_LOOP and len(self.original_queue) == 0:
-                # Store original queue for loop mode
-                self.original_queue = deepcopy(self.queue)
+                # Store original queue for loop mode, copying the tracks so
+                # playing them doesn't change the snapshot
+                self.original_queue = deque(copy(track) for track in self.queue)
                 if self.current_track.id:
-                    self.original_queue.appendleft(self.current_track)
+                    self.original_queue.appendleft(copy(self.current_track))
 
     def get_playback_mode(self) -> str:
         """Get the current playback mode
@@ -340,9 +424,11 @@ class MediaQueue:
         :return: None
         """
         self.logger.debug('Saving original queue for loop mode')
-        self.original_queue = deepcopy(self.queue)
+        # Copy the tracks, sharing them with the queue would let the offset,
+        # transcoded URI and failure flag set while playing leak into the snapshot
+        self.original_queue = deque(copy(track) for track in self.queue)
         if self.current_track.id:
-            self.original_queue.appendleft(deepcopy(self.current_track))
+            self.original_queue.appendleft(copy(self.current_track))
 
     def skip_current_track(self) -> Track:
         """Force skip to the next track
@@ -366,7 +452,7 @@ class MediaQueue:
             # Handle loop mode - restore original queue
             if self.playback_mode == self.MODE_LOOP and len(self.original_queue) > 0:
                 self.logger.debug('Loop mode: restoring original queue')
-                self.queue = deepcopy(self.original_queue)
+                self.queue = deque(copy(track) for track in self.original_queue)
                 self.history.clear()
             else:
                 # No more tracks - return empty track
@@ -383,13 +469,16 @@ class MediaQueue:
 
         return self.current_track
 
-    def mark_current_track_transcoded(self, new_uri: str) -> None:
+    def mark_current_track_transcoded(self, new_uri: str) -> Track:
         """Mark current track as using transcoded stream and update URI
 
         :param str new_uri: The new transcoded URI
-        :return: None
+        :return: The updated current track
+        :rtype: Track
         """
         self.logger.debug('Marking current track as transcoded')
         self.current_track.transcoded = True
         self.current_track.uri = new_uri
         self.current_track.offset = 0
+
+        return self.current_track
@@ -1,6 +1,50 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
+import random
+import threading
+import time
 from typing import Union
-from difflib import SequenceMatcher
+import unicodedata
+
+from rapidfuzz import fuzz
+
+# Album lists are reused for this many seconds, the cache holds at most
+# ALBUM_CACHE_SIZE artists
+ALBUM_CACHE_TTL = 300
+ALBUM_CACHE_SIZE = 256
+
+# Search results are reused for this many seconds, the cache holds at most
+# SEARCH_CACHE_SIZE distinct searches
+SEARCH_CACHE_TTL = 300
+SEARCH_CACHE_SIZE = 256
+
+# Threads shared by all requests for querying the second source while the
+# first is queried on the request's own thread
+MAX_PARALLEL_QUERIES = 4
+
+
+@lru_cache(maxsize=4096)
+def normalize_string(s: str) -> str:
+    """Normalize string for better matching
+
+    Case is folded and accents are removed, so a spoken 'beyonce' matches
+    'Beyoncé'.  The same titles, artists and albums are normalised on every
+    search that returns them, so results are cached.
+
+    :param str s: Input string
+    :return: Normalized string
+    :rtype: str
+    """
+    # Split accented characters into base character and combining mark, then
+    # drop the marks.  Other scripts are kept as they are
+    s = ''.join(c for c in unicodedata.normalize('NFKD', s) if not unicodedata.combining(c))
+    s = s.casefold().strip()
+    # Remove 'the' at the start
+    if s.startswith('the '):
+        s = s[4:]
+    return s
 
 
 class MediaService:
@@ -17,6 +61,10 @@ class MediaService:
         self.navidrome = navidrome_conn
         self.plex = plex_conn
         self.prefer_high_bitrate = prefer_high_bitrate
+        self._album_cache: OrderedDict = OrderedDict()  # (artist_id, source) -> (timestamp, albums)
+        self._search_cache: OrderedDict = OrderedDict()  # (method, args) -> (timestamp, results)
+        self._cache_lock = threading.Lock()  # Requests are handled on several threads
+        self._pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_QUERIES)  # Shared by _query_sources()
 
         self.logger.debug('MediaService initialized')
 
@@ -30,7 +78,7 @@ class MediaService:
             success = success and self.plex.ping()
         return success
 
-    def _fuzzy_match(self, s1: str, s2: str) -> float:
+    def _fuzzy_match(self, s1: str, s2: str, score_cutoff: float = 0.0) -> float:
         """Calculate similarity between two strings with substring awareness
 
         Prioritizes substring matches (when s2 is contained in s1) over
@@ -38,6 +86,8 @@ class MediaService:
 
         :param str s1: First string (typically the title)
         :param str s2: Second string (typically the search term)
+        :param float score_cutoff: Sequence match scores below this are returned as 0.0,
+            letting rapidfuzz give up early on strings that cannot reach it
         :return: Similarity ratio (0.0 to 1.0+)
         :rtype: float
         """
@@ -58,8 +108,12 @@ class MediaService:
         if s1_lower.startswith(s2_lower) or s2_lower.startswith(s1_lower):
             return 0.65
         
-        # Fallback to sequence matching for other cases
-        return SequenceMatcher(None, s1_lower, s2_lower).ratio()
+        # Fallback to sequence matching for other cases.  rapidfuzz's ratio is
+        # based on the longest common subsequence, so it is never lower than
+        # difflib's greedy SequenceMatcher ratio and often higher, e.g. 0.73
+        # rather than 0.36 for 'abbcaba' / 'bbab'.  Borderline candidates can
+        # therefore now pass the 0.6 threshold in _select_best_result()
+        return fuzz.ratio(s1_lower, s2_lower, score_cutoff=score_cutoff * 100) / 100.0
 
     def _normalize_string(self, s: str) -> str:
         """Normalize string for better matching
@@ -68,12 +122,7 @@ class MediaService:
         :return: Normalized string
         :rtype: str
         """
-        # Remove common words and punctuation for better matching
-        s = s.lower().strip()
-        # Remove 'the' at the start
-        if s.startswith('the '):
-            s = s[4:]
-        return s
+        return normalize_string(s)
 
     def _select_best_result(self, results: list, term: str, key: str = 'name') -> Union[dict, None]:
         """Select the best matching result using fuzzy matching
@@ -99,7 +148,9 @@ class MediaService:
             if normalized_value == normalized_term:
                 return result
 
-            score = self._fuzzy_match(normalized_value, normalized_term)
+            # Only a score above both the best so far and the 0.6 threshold can
+            # change the result, so anything lower may be rejected early
+            score = self._fuzzy_match(normalized_value, normalized_term, max(best_score, 0.6))
 
             # Boost score for prefix matches
             if normalized_value.startswith(normalized_term) or normalized_term.startswith(normalized_value):
@@ -115,6 +166,26 @@ class MediaService:
 
         return results[0] if results else None
 
+    def _remove_duplicates(self, songs: list) -> list:
+        """Remove repeated copies of the same song, keeping the first
+
+        When both servers hold the same library every song is returned
+        twice, the Navidrome copy comes first and is kept.
+
+        :param list songs: List of song dictionaries
+        :return: List without duplicates, in the original order
+        :rtype: list
+        """
+
+        song_map = {}
+        for song in songs:
+            key = (self._normalize_string(song.get('title') or ''),
+                   self._normalize_string(song.get('artist') or ''),
+                   self._normalize_string(song.get('album') or ''))
+            song_map.setdefault(key, song)
+
+        return list(song_map.values())
+
     def _select_highest_bitrate(self, songs: list) -> list:
         """Sort songs by bitrate (highest first) and remove duplicates
 
@@ -138,31 +209,118 @@ class MediaService:
 
         return list(song_map.values())
 
-    def search_artist(self, term: str) -> Union[list, None]:
-        """Search for an artist across all enabled sources
+    def _query_sources(self, method: str, *args) -> list:
+        """Call the same method on every enabled source
 
-        :param str term: The name of the artist
-        :return: A list of artists or None
-        :rtype: list | None
+        When both sources are enabled the calls run in parallel, so a
+        request waits for the slower server instead of both one after the other.
+        Navidrome is queried on the calling thread and Plex on the shared
+        pool, so each call only takes one pool thread.
+
+        :param str method: The name of the method to call on each connection
+        :param args: Arguments passed to the method
+        :return: A list of (source, result) tuples, Navidrome first
+        :rtype: list
+        """
+
+        sources = [(source, conn) for source, conn in (('navidrome', self.navidrome), ('plex', self.plex))
+                   if conn and hasattr(conn, method)]
+
+        if len(sources) < 2:
+            return [(source, getattr(conn, method)(*args)) for source, conn in sources]
+
+        (first_source, first_conn), (second_source, second_conn) = sources
+
+        future = self._pool.submit(getattr(second_conn, method), *args)
+        first_result = getattr(first_conn, method)(*args)
+
+        return [(first_source, first_result), (second_source, future.result())]
+
+    def _search_sources(self, method: str, *args) -> list:
+        """Run the same search against every enabled source
+
+        Searches run in parallel through _query_sources().  Users often repeat
+        a request, so results are kept in a small LRU cache for
+        SEARCH_CACHE_TTL seconds.
+
+        :param str method: The name of the search method to call on each connection
+        :param args: Arguments passed to the search method
+        :return: A list of (source, result) tuples, Navidrome first
+        :rtype: list
         """
 
-        self.logger.debug(f'Searching for artist: {term}')
+        key = (method, args)
+        now = time.monotonic()
+
+        with self._cache_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None and now - cached[0] < SEARCH_CACHE_TTL:
+                self._search_cache.move_to_end(key)
+                self.logger.debug('Search cache hit for: %s%s', method, args)
+                return cached[1]
+
+        results = self._query_sources(method, *args)
+
+        # Don't cache searches that found nothing
+        if any(result for _, result in results):
+            with self._cache_lock:
+                self._search_cache[key] = (now, results)
+                self._search_cache.move_to_end(key)
+                if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+
+        return results
+
+    def _search_all_sources(self, method: str, *args) -> list:
+        """Run a search on every enabled source and combine the results
+
+        :param str method: The name of the search method to call on each connection
+        :param args: Arguments passed to the search method
+        :return: A list of result dictionaries, each tagged with its 'source'
+        :rtype: list
+        """
 
         all_results = []
 
-        if self.navidrome:
-            result = self.navidrome.search_artist(term)
+        for source, result in self._search_sources(method, *args):
             if result:
                 for r in result:
-                    r['source'] = 'navidrome'
+                    r['source'] = source
                 all_results.extend(result)
 
-        if self.plex:
-            result = self.plex.search_artist(term)
+        return all_results
+
+    def _song_list_from_sources(self, method: str, *args) -> Union[list, None]:
+        """Build a song list from every enabled source
+
+        The song lists are random or change often, so unlike searches they
+        are never cached.
+
+        :param str method: The name of the song list method to call on each connection
+        :param args: Arguments passed to the song list method
+        :return: A list of (song_id, source) tuples or None
+        :rtype: list | None
+        """
+
+        all_songs = []
+
+        for source, result in self._query_sources(method, *args):
             if result:
-                for r in result:
-                    r['source'] = 'plex'
-                all_results.extend(result)
+                all_songs.extend([(sid, source) for sid in result])
+
+        return all_songs if all_songs else None
+
+    def search_artist(self, term: str) -> Union[list, None]:
+        """Search for an artist across all enabled sources
+
+        :param str term: The name of the artist
+        :return: A list of artists or None
+        :rtype: list | None
+        """
+
+        self.logger.debug('Searching for artist: %s', term)
+
+        all_results = self._search_all_sources('search_artist', term)
 
         if all_results:
             best = self._select_best_result(all_results, term)
@@ -178,23 +336,9 @@ class MediaService:
         :rtype: list | None
         """
 
-        self.logger.debug(f'Searching for album: {term}')
-
-        all_results = []
-
-        if self.navidrome:
-            result = self.navidrome.search_album(term)
-            if result:
-                for r in result:
-                    r['source'] = 'navidrome'
-                all_results.extend(result)
+        self.logger.debug('Searching for album: %s', term)
 
-        if self.plex:
-            result = self.plex.search_album(term)
-            if result:
-                for r in result:
-                    r['source'] = 'plex'
-                all_results.extend(result)
+        all_results = self._search_all_sources('search_album', term)
 
         if all_results:
             best = self._select_best_result(all_results, term)
@@ -210,27 +354,17 @@ class MediaService:
         :rtype: list | None
         """
 
-        self.logger.debug(f'Searching for song: {term}')
-
-        all_results = []
-
-        if self.navidrome:
-            result = self.navidrome.search_song(term)
-            if result:
-                for r in result:
-                    r['source'] = 'navidrome'
-                all_results.extend(result)
+        self.logger.debug('Searching for song: %s', term)
 
-        if self.plex:
-            result = self.plex.search_song(term)
-            if result:
-                for r in result:
-                    r['source'] = 'plex'
-                all_results.extend(result)
+        all_results = self._search_all_sources('search_song', term)
 
         if all_results:
-            # Apply bitrate preference if enabled
-            all_results = self._select_highest_bitrate(all_results)
+            # Apply bitrate preference if enabled, otherwise just drop copies
+            # of the same song so they are not scored and queued twice
+            if self.prefer_high_bitrate:
+                all_results = self._select_highest_bitrate(all_results)
+            else:
+                all_results = self._remove_duplicates(all_results)
 
             # Sort by fuzzy match score
             normalized_term = self._normalize_string(term)
@@ -255,27 +389,17 @@ class MediaService:
         :rtype: list | None
         """
 
-        self.logger.debug(f'Searching for song: {song_term} from album: {album_term}')
+        self.logger.debug('Searching for song: %s from album: %s', song_term, album_term)
 
-        all_results = []
-
-        if self.navidrome and hasattr(self.navidrome, 'search_song_from_album'):
-            result = self.navidrome.search_song_from_album(song_term, album_term)
-            if result:
-                for r in result:
-                    r['source'] = 'navidrome'
-                all_results.extend(result)
-
-        if self.plex and hasattr(self.plex, 'search_song_from_album'):
-            result = self.plex.search_song_from_album(song_term, album_term)
-            if result:
-                for r in result:
-                    r['source'] = 'plex'
-                all_results.extend(result)
+        all_results = self._search_all_sources('search_song_from_album', song_term, album_term)
 
         if all_results:
-            # Apply bitrate preference if enabled
-            all_results = self._select_highest_bitrate(all_results)
+            # Apply bitrate preference if enabled, otherwise just drop copies
+            # of the same song so they are not scored and queued twice
+            if self.prefer_high_bitrate:
+                all_results = self._select_highest_bitrate(all_results)
+            else:
+                all_results = self._remove_duplicates(all_results)
 
             # Sort by combined song + album match score
             normalized_song = self._normalize_string(song_term)
@@ -302,17 +426,11 @@ class MediaService:
         :rtype: tuple | None
         """
 
-        self.logger.debug(f'Searching for playlist: {term}')
+        self.logger.debug('Searching for playlist: %s', term)
 
-        if self.navidrome:
-            result = self.navidrome.search_playlist(term)
+        for source, result in self._search_sources('search_playlist', term):
             if result:
-                return (result, 'navidrome')
-
-        if self.plex:
-            result = self.plex.search_playlist(term)
-            if result:
-                return (result, 'plex')
+                return (result, source)
 
         return None
 
@@ -331,11 +449,51 @@ class MediaService:
         return self.navidrome or self.plex
 
     def albums_by_artist(self, artist_id: str, source: str = 'navidrome') -> list:
-        """Get albums for a given artist from the specified source"""
+        """Get albums for a given artist from the specified source
+
+        Each album gets a lower case 'name_lc' key so callers can match album
+        names without lower casing every entry.  Results are kept in a small
+        LRU cache for ALBUM_CACHE_TTL seconds.  Navidrome shuffles album lists
+        to keep generic requests fresh, so cached Navidrome lists are returned
+        as a freshly shuffled copy.
+
+        :param str artist_id: The artist ID
+        :param str source: The source of the artist ('navidrome' or 'plex')
+        :return: A list of album dictionaries
+        :rtype: list
+        """
+
+        key = (artist_id, source)
+        now = time.monotonic()
+
+        with self._cache_lock:
+            cached = self._album_cache.get(key)
+            if cached is not None and now - cached[0] < ALBUM_CACHE_TTL:
+                self._album_cache.move_to_end(key)
+                albums = cached[1]
+
+                if source == 'navidrome':
+                    return random.sample(albums, len(albums))
+
+                return albums
+
         conn = self.get_connection_for_source(source)
-        if conn:
-            return conn.albums_by_artist(artist_id)
-        return []
+        if not conn:
+            return []
+
+        albums = conn.albums_by_artist(artist_id)
+        for album in albums:
+            album['name_lc'] = (album.get('name') or '').lower()
+
+        # Don't cache failed or empty lookups
+        if albums:
+            with self._cache_lock:
+                self._album_cache[key] = (now, albums)
+                self._album_cache.move_to_end(key)
+                if len(self._album_cache) > ALBUM_CACHE_SIZE:
+                    self._album_cache.popitem(last=False)
+
+        return albums
 
     def build_song_list_from_albums(self, albums: list, length: int, source: str = 'navidrome') -> list:
         """Build song list from albums using the specified source"""
@@ -353,51 +511,15 @@ class MediaService:
 
     def build_song_list_from_genre(self, genre: str, count: int) -> Union[list, None]:
         """Build song list from genre across sources"""
-        all_songs = []
-
-        if self.navidrome:
-            result = self.navidrome.build_song_list_from_genre(genre, count)
-            if result:
-                all_songs.extend([(sid, 'navidrome') for sid in result])
-
-        if self.plex:
-            result = self.plex.build_song_list_from_genre(genre, count)
-            if result:
-                all_songs.extend([(sid, 'plex') for sid in result])
-
-        return all_songs if all_songs else None
+        return self._song_list_from_sources('build_song_list_from_genre', genre, count)
 
     def build_random_song_list(self, count: int) -> Union[list, None]:
         """Build random song list across sources"""
-        all_songs = []
-
-        if self.navidrome:
-            result = self.navidrome.build_random_song_list(count)
-            if result:
-                all_songs.extend([(sid, 'navidrome') for sid in result])
-
-        if self.plex:
-            result = self.plex.build_random_song_list(count)
-            if result:
-                all_songs.extend([(sid, 'plex') for sid in result])
-
-        return all_songs if all_songs else None
+        return self._song_list_from_sources('build_random_song_list', count)
 
     def build_song_list_from_favourites(self) -> Union[list, None]:
         """Build favorite songs list across sources"""
-        all_songs = []
-
-        if self.navidrome:
-            result = self.navidrome.build_song_list_from_favourites()
-            if result:
-                all_songs.extend([(sid, 'navidrome') for sid in result])
-
-        if self.plex:
-            result = self.plex.build_song_list_from_favourites()
-            if result:
-                all_songs.extend([(sid, 'plex') for sid in result])
-
-        return all_songs if all_songs else None
+        return self._song_list_from_sources('build_song_list_from_favourites')
 
     def get_song_details(self, song_id: str, source: str = 'navidrome') -> dict:
         """Get song details from the specified source"""
@@ -3,15 +3,22 @@ import os
 import re
 import urllib.parse
 from typing import Union, Optional, List, Any
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import plexapi
 from plexapi.server import PlexServer
 from plexapi.library import MusicSection
 from plexapi.audio import Track as PlexTrack
 import plexapi.exceptions
 
+logger = logging.getLogger(__name__)
 
+# Maximum number of Plex requests issued in parallel by _get_json_many()
+MAX_PARALLEL_REQUESTS = 8
 
 
 
@@ -27,30 +34,81 @@ class PlexConnection:
         :return: None
         """
 
-        self.logger = logging.getLogger(__name__)
-
         self.server_url = server_url.rstrip('/')
         self.token = token
         self.port = port
         self.base_url = f"{self.server_url}:{self.port}"
+        self._search_url = f"{self.base_url}/hubs/search"  # Hub search endpoint, used by every search method
         self.headers = {
             'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',  # Plex compresses JSON listings well
             'X-Plex-Token': self.token
         }
         self.prefer_high_bitrate = prefer_high_bitrate
+        self._session: Optional[requests.Session] = None  # Pooled HTTP session, see the session property
+        self._session_pid: Optional[int] = None
         self._music_library_key = None  # Cache the music library key
         self._music_section: Optional[MusicSection] = None  # Cache the music section object
+        self._pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS)  # Shared by _get_json_many()
 
         # Initialize official PlexServer SDK
         self._plex_sdk: Optional[PlexServer] = None
         try:
             self._plex_sdk = PlexServer(self.server_url, self.token)
-            self.logger.debug('Plex SDK (plexapi) initialized successfully')
+            logger.debug('Plex SDK (plexapi) initialized successfully')
         except Exception as e:
-            self.logger.warning(f'Failed to initialize Plex SDK: {e}')
+            logger.warning('Failed to initialize Plex SDK: %s', e)
             self._plex_sdk = None
 
-        self.logger.debug('PlexConnection initialized')
+        logger.debug('PlexConnection initialized')
+
+    def __enter__(self) -> 'PlexConnection':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session used for all Plex API requests
+
+        Every request goes to the same Plex host, so a single keep-alive
+        connection pool avoids a new TCP (and TLS) handshake per call.
+        The Plex headers are installed on the session once rather than
+        being passed (and merged) on every request.
+        The session is recreated after a fork so background worker
+        processes never share sockets with the parent process.
+
+        :return: The requests Session for this process
+        :rtype: requests.Session
+        """
+
+        if self._session is None or self._session_pid != os.getpid():
+            session = requests.Session()
+            session.headers.update(self.headers)
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+
+            self._session = session
+            self._session_pid = os.getpid()
+
+        return self._session
+
+    def close(self) -> None:
+        """Close the pooled HTTP session
+
+        :return: None
+        """
+
+        if self._session is not None and self._session_pid == os.getpid():
+            self._session.close()
+        self._session = None
+        self._session_pid = None
 
     def ping(self) -> bool:
         """Ping Plex server
@@ -61,19 +119,19 @@ class PlexConnection:
         :rtype: bool
         """
 
-        self.logger.debug('In function ping()')
+        logger.debug('In function ping()')
 
         try:
-            response = requests.get(f"{self.base_url}/", headers=self.headers, timeout=10)
+            response = self.session.get(f"{self.base_url}/", timeout=10)
 
             if response.status_code == 200:
-                self.logger.info('Successfully connected to Plex')
+                logger.info('Successfully connected to Plex')
                 return True
             else:
-                self.logger.error(f'Failed to connect to Plex: {response.status_code}')
+                logger.error('Failed to connect to Plex: %s', response.status_code)
                 return False
         except requests.RequestException as e:
-            self.logger.error(f'Failed to connect to Plex: {e}')
+            logger.error('Failed to connect to Plex: %s', e)
             return False
 
     def _get_music_library_key(self) -> Union[str, None]:
@@ -87,7 +145,7 @@ class PlexConnection:
         :rtype: str | None
         """
 
-        self.logger.debug('In function _get_music_library_key()')
+        logger.debug('In function _get_music_library_key()')
 
         # Return cached value if available
         if self._music_library_key:
@@ -96,31 +154,30 @@ class PlexConnection:
         music_section_name = os.getenv('MUSIC_SECTION', '').strip()
         
         try:
-            response = requests.get(f"{self.base_url}/library/sections", headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
+            data = self._get_json(f"{self.base_url}/library/sections")
+            if data is not None:
                 directories = data.get('MediaContainer', {}).get('Directory', [])
                 
                 # If MUSIC_SECTION env var is set, look for section by name
                 if music_section_name:
-                    self.logger.info(f'Looking for music library section by name: {music_section_name}')
+                    logger.info('Looking for music library section by name: %s', music_section_name)
                     for directory in directories:
                         if directory.get('title', '').lower() == music_section_name.lower():
                             self._music_library_key = directory.get('key')
-                            self.logger.debug(f'Found music library "{directory.get("title")}" with key {self._music_library_key}')
+                            logger.debug('Found music library "%s" with key %s', directory.get("title"), self._music_library_key)
                             return self._music_library_key
                     # Section name not found, log warning and fall through to type-based search
-                    self.logger.warning(f'Music section "{music_section_name}" not found, falling back to type-based search')
+                    logger.warning('Music section "%s" not found, falling back to type-based search', music_section_name)
                 
                 # Fallback: Find first music library by type
                 for directory in directories:
                     if directory.get('type') == 'artist':
                         self._music_library_key = directory.get('key')
-                        self.logger.debug(f'Found music library "{directory.get("title")}" with key {self._music_library_key} via HTTP API')
+                        logger.debug('Found music library "%s" with key %s via HTTP API', directory.get("title"), self._music_library_key)
                         return self._music_library_key
                         
         except requests.RequestException as e:
-            self.logger.error(f'Error getting music library: {e}')
+            logger.error('Error getting music library: %s', e)
 
         return None
 
@@ -135,14 +192,14 @@ class PlexConnection:
         :rtype: MusicSection | None
         """
 
-        self.logger.debug('In function _get_music_section()')
+        logger.debug('In function _get_music_section()')
 
         # Return cached value if available
         if self._music_section:
             return self._music_section
 
         if not self._plex_sdk:
-            self.logger.debug('Plex SDK not available, cannot get music section')
+            logger.debug('Plex SDK not available, cannot get music section')
             return None
 
         music_section_name = os.getenv('MUSIC_SECTION', '').strip()
@@ -150,27 +207,27 @@ class PlexConnection:
         try:
             # If MUSIC_SECTION env var is set, look for section by name
             if music_section_name:
-                self.logger.info(f'Looking for music library section by name: {music_section_name}')
+                logger.info('Looking for music library section by name: %s', music_section_name)
                 try:
                     section = self._plex_sdk.library.section(music_section_name)
                     if isinstance(section, MusicSection):
                         self._music_section = section
-                        self.logger.debug(f'Found music section "{section.title}" with key {section.key}')
+                        logger.debug('Found music section "%s" with key %s', section.title, section.key)
                         return self._music_section
                     else:
-                        self.logger.warning(f'Section "{music_section_name}" is not a music section')
+                        logger.warning('Section "%s" is not a music section', music_section_name)
                 except plexapi.exceptions.NotFound:
-                    self.logger.warning(f'Music section "{music_section_name}" not found via SDK')
+                    logger.warning('Music section "%s" not found via SDK', music_section_name)
             
             # Fallback: Find first music library by type
             for section in self._plex_sdk.library.sections():
                 if isinstance(section, MusicSection):
                     self._music_section = section
-                    self.logger.debug(f'Found music section "{section.title}" with key {section.key} via SDK')
+                    logger.debug('Found music section "%s" with key %s via SDK', section.title, section.key)
                     return self._music_section
                         
         except Exception as e:
-            self.logger.error(f'Error getting music section from SDK: {e}')
+            logger.error('Error getting music section from SDK: %s', e)
 
         return None
 
@@ -368,7 +425,7 @@ class PlexConnection:
                 ]
             )
         except Exception as e:
-            self.logger.error(f"[ Error extracting track artists: {str(e)}")
+            logger.error("[ Error extracting track artists: %s", e)
             return []
         
     def _get_track_title(self, track) -> str:
@@ -392,7 +449,7 @@ class PlexConnection:
             )
             return titles[0] if titles else ""
         except Exception as e:
-            self.logger.error(f"Error extracting track title: {str(e)}")
+            logger.error("Error extracting track title: %s", e)
             return ""
 
     def _get_all_track_albums(self,track) -> List[str]:
@@ -418,7 +475,7 @@ class PlexConnection:
                 ]
             )
         except Exception as e:
-            self.logger.error(f"Error extracting album names: {str(e)}")
+            logger.error("Error extracting album names: %s", e)
             return []
         
     def _get_track_media_info(self,track):
@@ -471,7 +528,7 @@ class PlexConnection:
             }
             return media_info
         except Exception as e:
-            self.logger.error(f"Error extracting media info: {str(e)}")
+            logger.error("Error extracting media info: %s", e)
             return {
                 'audioCodec': None,
                 'bitrate': None,
@@ -557,7 +614,7 @@ class PlexConnection:
                         result['background'] = img_url
             
         except Exception as e:
-            self.logger.error(f"Error extracting poster info: {str(e)}")
+            logger.error("Error extracting poster info: %s", e)
         
         return result
 
@@ -632,6 +689,77 @@ class PlexConnection:
             })
         return songs
 
+    def _get_json(self, url: str, params: dict = None) -> Union[dict, None]:
+        """GET a Plex API endpoint and decode the JSON response
+
+        Every JSON request made by this class goes through here so they all
+        share the pooled session, headers, timeout and decoder.
+
+        :param str url: The fully qualified endpoint URL
+        :param dict params: Optional query string parameters
+        :return: The decoded JSON response or None if the status was not 200 or the body was not valid JSON
+        :rtype: dict | None
+        :raises requests.RequestException: If the HTTP request fails
+        """
+
+        response = self.session.get(url, params=params, timeout=10)
+        if response.status_code != 200:
+            logger.debug('Plex returned HTTP %s for %s', response.status_code, url)
+            return None
+
+        # orjson raises a ValueError rather than a RequestException, so an
+        # HTML error page or truncated body must be handled here
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            logger.error('Invalid JSON from Plex for %s: %s', url, e)
+            return None
+
+    def _get_json_many(self, urls: List[str]) -> List[Union[dict, None]]:
+        """GET several Plex API endpoints in parallel
+
+        The requests share the pooled session, so they reuse its keep-alive
+        connections instead of paying one round trip after another.
+
+        :param list urls: The fully qualified endpoint URLs
+        :return: The decoded JSON responses in the same order as urls, None for failed requests
+        :rtype: list
+        """
+
+        def fetch(url: str) -> Union[dict, None]:
+            try:
+                return self._get_json(url)
+            except requests.RequestException as e:
+                logger.error('Error requesting %s: %s', url, e)
+                return None
+
+        if len(urls) <= 1:
+            return [fetch(url) for url in urls]
+
+        # Create the session before starting threads so they all share it
+        self.session
+
+        return list(self._pool.map(fetch, urls))
+
+    def _hub_search(self, term: str, limit: int, section_id: str = None) -> Union[dict, None]:
+        """Query the hub search endpoint
+
+        Results are cached by MediaService, so responses are not cached here.
+
+        :param str term: The (already cleaned) search term
+        :param int limit: Maximum number of results per hub
+        :param str section_id: Optional library section ID to scope the search
+        :return: The decoded JSON response or None if the request failed
+        :rtype: dict | None
+        :raises requests.RequestException: If the HTTP request fails
+        """
+
+        params = {'query': term, 'limit': limit}
+        if section_id is not None:
+            params['sectionId'] = section_id
+
+        return self._get_json(self._search_url, params=params)
+
     def _perform_hub_search(self, term: str, limit: int = 20) -> list:
         """Perform a hub search (global search across all content)
 
@@ -642,23 +770,17 @@ class PlexConnection:
         """
         # Clean the search term to handle special characters
         term = self._clean_search_term(term)
-        self.logger.debug(f'Performing hub search for: {term}')
+        logger.debug('Performing hub search for: %s', term)
 
         try:
-            encoded_term = urllib.parse.quote(term)
-            response = requests.get(
-                f"{self.base_url}/hubs/search?query={encoded_term}&limit={limit}",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._hub_search(term, limit)
 
-            if response.status_code == 200:
-                data = response.json()
+            if data:
                 track_hub = self._extract_track_hub(data)
                 if track_hub and 'Metadata' in track_hub:
                     return self._parse_track_metadata(track_hub['Metadata'])
         except requests.RequestException as e:
-            self.logger.error(f'Error in hub search: {e}')
+            logger.error('Error in hub search: %s', e)
 
         return []
 
@@ -673,26 +795,20 @@ class PlexConnection:
         """
         # Clean the search term to handle special characters
         term = self._clean_search_term(term)
-        self.logger.debug(f'Performing hub search with section {section_id} for: {term}')
+        logger.debug('Performing hub search with section %s for: %s', section_id, term)
 
         try:
-            encoded_term = urllib.parse.quote(term)
-            response = requests.get(
-                f"{self.base_url}/hubs/search?query={encoded_term}&sectionId={section_id}&limit={limit}",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._hub_search(term, limit, section_id)
 
-            if response.status_code == 200:
-                data = response.json()
-                self.logger.debug(f'Hub search with section response data: {data}')
+            if data:
+                logger.debug('Hub search with section response data: %s', data)
                 track_hub = self._extract_track_hub(data)
                 if track_hub and 'Metadata' in track_hub:
                     tracks = self._parse_track_metadata(track_hub['Metadata'])
-                    self.logger.debug(f'Hub search found {(tracks)} tracks')
+                    logger.debug('Hub search found %s tracks', tracks)
                     return tracks
         except requests.RequestException as e:
-            self.logger.error(f'Error in hub search with section: {e}')
+            logger.error('Error in hub search with section: %s', e)
 
         return []
 
@@ -710,26 +826,23 @@ class PlexConnection:
         """
         # Clean the search term to handle special characters
         term = self._clean_search_term(term)
-        self.logger.debug(f'Performing direct library search for: {term}')
+        logger.debug('Performing direct library search for: %s', term)
 
         try:
-            encoded_term = urllib.parse.quote(term)
-            response = requests.get(
-                f"{self.base_url}/library/sections/{section_id}/all?title={encoded_term}&type=10&limit={limit}",
-                headers=self.headers,
-                timeout=10
+            data = self._get_json(
+                f"{self.base_url}/library/sections/{section_id}/all",
+                params={'title': term, 'type': 10, 'limit': limit}
             )
 
-            if response.status_code == 200:
-                data = response.json()
-                self.logger.debug(f'Direct library search response data: {data}')
+            if data is not None:
+                logger.debug('Direct library search response data: %s', data)
                 metadata = data.get('MediaContainer', {}).get('Metadata', [])
                 if metadata:
                     tracks = self._parse_track_metadata(metadata)
-                    self.logger.debug(f'Direct library search found {(tracks)} tracks')
+                    logger.debug('Direct library search found %s tracks', tracks)
                     return tracks
         except requests.RequestException as e:
-            self.logger.error(f'Error in direct library search: {e}')
+            logger.error('Error in direct library search: %s', e)
 
         return []
 
@@ -797,7 +910,7 @@ class PlexConnection:
                 'allAlbums': [album] if album else [],
             }
         except Exception as e:
-            self.logger.error(f'Error parsing SDK track: {e}')
+            logger.error('Error parsing SDK track: %s', e)
             return {}
 
     def _perform_api_client_search(self, term: str, section_id: str, limit: int = 20) -> list:
@@ -813,25 +926,25 @@ class PlexConnection:
         :rtype: list
         """
         if not self._plex_sdk:
-            self.logger.debug('Plex SDK not available, skipping API client search')
+            logger.debug('Plex SDK not available, skipping API client search')
             return []
         
         # Clean the search term to handle special characters
         term = self._clean_search_term(term)
-        self.logger.debug(f'Performing SDK search for: {term}')
+        logger.debug('Performing SDK search for: %s', term)
         
         try:
             # Get the music section using the SDK
             music_section = self._get_music_section()
             if not music_section:
-                self.logger.debug('Music section not available, skipping SDK search')
+                logger.debug('Music section not available, skipping SDK search')
                 return []
             
             # Use the MusicSection.searchTracks() method for track-specific search
             # This returns a list of plexapi.audio.Track objects
             tracks = music_section.searchTracks(title=term, maxresults=limit)
             
-            self.logger.debug(f'SDK searchTracks found {tracks} tracks')
+            logger.debug('SDK searchTracks found %s tracks', tracks)
             
             # Parse the Track objects into our standardized format
             parsed_tracks = []
@@ -840,11 +953,11 @@ class PlexConnection:
                 if parsed_track and parsed_track.get('id'):
                     parsed_tracks.append(parsed_track)
             
-            self.logger.debug(f'SDK search parsed {len(parsed_tracks)} tracks successfully')
+            logger.debug('SDK search parsed %s tracks successfully', len(parsed_tracks))
             return parsed_tracks
             
         except Exception as e:
-            self.logger.error(f'Error in SDK search: {e}')
+            logger.error('Error in SDK search: %s', e)
         
         return []
 
@@ -866,7 +979,7 @@ class PlexConnection:
         if track_title == normalized_term:
             score = 1.0
             if log_details:
-                self.logger.debug(f'  └─ Title: EXACT MATCH (score: 1.0)')
+                logger.debug('  └─ Title: EXACT MATCH (score: 1.0)')
         else:
             # Check if search term is contained in title (substring match)
             # This is more important than fuzzy similarity for short search terms
@@ -876,12 +989,12 @@ class PlexConnection:
                 coverage = len(normalized_term) / len(track_title) if track_title else 0
                 score = 0.7 + (coverage * 0.25)  # Range: 0.7 to 0.95 based on coverage
                 if log_details:
-                    self.logger.debug(f'  └─ Title CONTAINS search term: {score:.3f} (coverage: {coverage:.2f}, "{track_title}" contains "{normalized_term}")')
+                    logger.debug('  └─ Title CONTAINS search term: %.3f (coverage: %.2f, "%s" contains "%s")', score, coverage, track_title, normalized_term)
             else:
                 # Fallback to fuzzy match only when no substring match
                 score = self._fuzzy_match(track_title, normalized_term)
                 if log_details:
-                    self.logger.debug(f'  └─ Title fuzzy match: {score:.3f} ("{track_title}" vs "{normalized_term}")')
+                    logger.debug('  └─ Title fuzzy match: %.3f ("%s" vs "%s")', score, track_title, normalized_term)
 
         # Boost score for prefix matches
         prefix_bonus = 0.0
@@ -889,7 +1002,7 @@ class PlexConnection:
             prefix_bonus = 0.15  # Increased bonus for prefix matches
             score += prefix_bonus
             if log_details:
-                self.logger.debug(f'  └─ Prefix match bonus: +{prefix_bonus}')
+                logger.debug('  └─ Prefix match bonus: +%s', prefix_bonus)
 
         # Artist matching bonus (if artist provided)
         artist_bonus = 0.0
@@ -908,7 +1021,7 @@ class PlexConnection:
             artist_bonus = artist_score * 0.3
             score += artist_bonus
             if log_details:
-                self.logger.debug(f'  └─ Artist match: {artist_score:.3f}, bonus: +{artist_bonus:.3f} ("{track_artist}" vs "{normalized_artist}")')
+                logger.debug('  └─ Artist match: %.3f, bonus: +%.3f ("%s" vs "%s")', artist_score, artist_bonus, track_artist, normalized_artist)
 
         # Check if search term appears in artist name (even without explicit artist search)
         # This helps when someone searches for "ranu" and it's in the artist name "Ranu Mondal"
@@ -919,7 +1032,7 @@ class PlexConnection:
             term_in_artist_bonus = 0.25  # Significant bonus for term appearing in artist
             score += term_in_artist_bonus
             if log_details:
-                self.logger.debug(f'  └─ Search term found in artist: +{term_in_artist_bonus} ("{normalized_term}" in "{track_artist or original_artist}")')
+                logger.debug('  └─ Search term found in artist: +%s ("%s" in "%s")', term_in_artist_bonus, normalized_term, track_artist or original_artist)
 
         # Bitrate bonus when prefer_high_bitrate is enabled
         bitrate_bonus = 0.0
@@ -930,10 +1043,10 @@ class PlexConnection:
                 bitrate_bonus = min(bitrate / 15000, 0.1)
                 score += bitrate_bonus
                 if log_details:
-                    self.logger.debug(f'  └─ Bitrate bonus: +{bitrate_bonus:.3f} ({bitrate} kbps)')
+                    logger.debug('  └─ Bitrate bonus: +%.3f (%s kbps)', bitrate_bonus, bitrate)
 
         if log_details:
-            self.logger.debug(f'  └─ TOTAL SCORE: {score:.3f}')
+            logger.debug('  └─ TOTAL SCORE: %.3f', score)
 
         return score
 
@@ -949,19 +1062,19 @@ class PlexConnection:
         if not tracks:
             return []
 
-        self.logger.debug('=' * 80)
-        self.logger.debug('SCORING ALL TRACKS:')
-        self.logger.debug('=' * 80)
+        logger.debug('=' * 80)
+        logger.debug('SCORING ALL TRACKS:')
+        logger.debug('=' * 80)
 
         # Calculate scores and attach to tracks
         scored_tracks = []
         for idx, track in enumerate(tracks, 1):
             search_method = track.get('_search_method', 'unknown')
-            self.logger.debug(f'\nTrack #{idx} (from {search_method}):')
-            self.logger.debug(f'  Title: "{track.get("title", "N/A")}"')
-            self.logger.debug(f'  Artist: "{track.get("artist", "N/A")}"')
-            self.logger.debug(f'  Album: "{track.get("album", "N/A")}"')
-            self.logger.debug(f'  BitRate: {track.get("bitRate", 0)} kbps')
+            logger.debug('\nTrack #%s (from %s):', idx, search_method)
+            logger.debug('  Title: "%s"', track.get("title", "N/A"))
+            logger.debug('  Artist: "%s"', track.get("artist", "N/A"))
+            logger.debug('  Album: "%s"', track.get("album", "N/A"))
+            logger.debug('  BitRate: %s kbps', track.get("bitRate", 0))
             
             score = self._calculate_match_score(track, search_term, search_artist, log_details=True)
             scored_tracks.append((score, track))
@@ -985,28 +1098,28 @@ class PlexConnection:
                     existing_bitrate = existing[1].get('bitRate', 0) or 0
                     new_bitrate = track.get('bitRate', 0) or 0
                     if new_bitrate > existing_bitrate:
-                        self.logger.debug(f'\n  → Replaced duplicate with higher bitrate: {new_bitrate} > {existing_bitrate}')
+                        logger.debug('\n  → Replaced duplicate with higher bitrate: %s > %s', new_bitrate, existing_bitrate)
                         track_map[key] = (score, track)
 
             scored_tracks = list(track_map.values())
             scored_tracks.sort(key=lambda x: x[0], reverse=True)
 
-        self.logger.debug('\n' + '=' * 80)
-        self.logger.debug('FINAL RANKING (top 5):')
-        self.logger.debug('=' * 80)
+        logger.debug('\n' + '=' * 80)
+        logger.debug('FINAL RANKING (top 5):')
+        logger.debug('=' * 80)
         for idx, (score, track) in enumerate(scored_tracks[:5], 1):
             search_method = track.get('_search_method', 'unknown')
-            self.logger.debug(f'#{idx} [Score: {score:.3f}] [{search_method}] "{track.get("title")}" by "{track.get("artist")}"')
+            logger.debug('#%s [Score: %.3f] [%s] "%s" by "%s"', idx, score, search_method, track.get("title"), track.get("artist"))
         
         if scored_tracks:
             best_score, best_track = scored_tracks[0]
             best_method = best_track.get('_search_method', 'unknown')
-            self.logger.debug('\n' + '=' * 80)
-            self.logger.debug(f'✓ SELECTED: "{best_track.get("title")}" by "{best_track.get("artist")}"')
-            self.logger.debug(f'  Score: {best_score:.3f}')
-            self.logger.debug(f'  Method: {best_method}')
-            self.logger.debug(f'  BitRate: {best_track.get("bitRate", 0)} kbps')
-            self.logger.debug('=' * 80 + '\n')
+            logger.debug('\n' + '=' * 80)
+            logger.debug('✓ SELECTED: "%s" by "%s"', best_track.get("title"), best_track.get("artist"))
+            logger.debug('  Score: %.3f', best_score)
+            logger.debug('  Method: %s', best_method)
+            logger.debug('  BitRate: %s kbps', best_track.get("bitRate", 0))
+            logger.debug('=' * 80 + '\n')
 
         return [track for score, track in scored_tracks]
 
@@ -1032,7 +1145,7 @@ class PlexConnection:
         ## commenting out all other search methods except SDK for now
 
         # Search method 1: Hub search (global)
-        # self.logger.debug('Trying hub search...')
+        # logger.debug('Trying hub search...')
         # hub_results = self._perform_hub_search(term)
         # for track in hub_results:
         #     track_id = track.get('id')
@@ -1040,11 +1153,11 @@ class PlexConnection:
         #         seen_ids.add(track_id)
         #         track['_search_method'] = 'hub'
         #         all_results.append(track)
-        # self.logger.debug(f'Hub search found {len(hub_results)} tracks')
+        # logger.debug('Hub search found %s tracks', len(hub_results))
 
         # Search method 2: Hub search with section ID
         # if library_key:
-        #     self.logger.debug('Trying hub search with section ID...')
+        #     logger.debug('Trying hub search with section ID...')
         #     hub_section_results = self._perform_hub_search_with_section(term, library_key)
         #     new_count = 0
         #     for track in hub_section_results:
@@ -1054,11 +1167,11 @@ class PlexConnection:
         #             track['_search_method'] = 'hub_section'
         #             all_results.append(track)
         #             new_count += 1
-        #     self.logger.debug(f'Hub search with section found {len(hub_section_results)} tracks ({new_count} new)')
+        #     logger.debug('Hub search with section found %s tracks (%s new)', len(hub_section_results), new_count)
 
         # Search method 3: Direct library search
         if library_key:
-            self.logger.debug('Trying direct library search...')
+            logger.debug('Trying direct library search...')
             direct_results = self._perform_direct_library_search(term, library_key)
             new_count = 0
             for track in direct_results:
@@ -1068,11 +1181,11 @@ class PlexConnection:
                     track['_search_method'] = 'direct'
                     all_results.append(track)
                     new_count += 1
-            self.logger.debug(f'Direct library search found {len(direct_results)} tracks ({new_count} new)')
+            logger.debug('Direct library search found %s tracks (%s new)', len(direct_results), new_count)
 
         # Search method 4: Official plexapi SDK-based search
         if library_key and self._plex_sdk:
-            self.logger.debug('Trying official plexapi SDK search...')
+            logger.debug('Trying official plexapi SDK search...')
             api_results = self._perform_api_client_search(term, library_key)
             new_count = 0
             for track in api_results:
@@ -1082,9 +1195,9 @@ class PlexConnection:
                     track['_search_method'] = 'sdk'
                     all_results.append(track)
                     new_count += 1
-            self.logger.debug(f'SDK search found {len(api_results)} tracks ({new_count} new)')
+            logger.debug('SDK search found %s tracks (%s new)', len(api_results), new_count)
 
-        self.logger.debug(f'Total unique tracks from all search methods: {len(all_results)}')
+        logger.debug('Total unique tracks from all search methods: %s', len(all_results))
 
         # Score and sort all results
         return self._select_best_tracks(all_results, term, artist)
@@ -1097,21 +1210,15 @@ class PlexConnection:
         :rtype: list | None
         """
 
-        self.logger.debug('In function search_artist()')
+        logger.debug('In function search_artist()')
 
         # Clean the search term to handle special characters
         term = self._clean_search_term(term)
 
         try:
-            encoded_term = urllib.parse.quote(term)
-            response = requests.get(
-                f"{self.base_url}/hubs/search?query={encoded_term}&limit=10",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._hub_search(term, 10)
 
-            if response.status_code == 200:
-                data = response.json()
+            if data:
                 hubs = data.get('MediaContainer', {}).get('Hub', [])
 
                 for hub in hubs:
@@ -1119,10 +1226,10 @@ class PlexConnection:
                         metadata = hub.get('Metadata', [])
                         if metadata:
                             artists = [{'id': m.get('ratingKey'), 'name': m.get('title')} for m in metadata]
-                            self.logger.debug(f'Found {len(artists)} artists for term: {term}')
+                            logger.debug('Found %s artists for term: %s', len(artists), term)
                             return artists
         except requests.RequestException as e:
-            self.logger.error(f'Error searching artist: {e}')
+            logger.error('Error searching artist: %s', e)
 
         return None
 
@@ -1134,21 +1241,15 @@ class PlexConnection:
         :rtype: list | None
         """
 
-        self.logger.debug('In function search_album()')
+        logger.debug('In function search_album()')
 
         # Clean the search term to handle special characters
         term = self._clean_search_term(term)
 
         try:
-            encoded_term = urllib.parse.quote(term)
-            response = requests.get(
-                f"{self.base_url}/hubs/search?query={encoded_term}&limit=10",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._hub_search(term, 10)
 
-            if response.status_code == 200:
-                data = response.json()
+            if data:
                 hubs = data.get('MediaContainer', {}).get('Hub', [])
 
                 for hub in hubs:
@@ -1162,10 +1263,10 @@ class PlexConnection:
                                 'artistId': m.get('parentRatingKey'),
                                 'songCount': m.get('leafCount', 0)
                             } for m in metadata]
-                            self.logger.debug(f'Found {len(albums)} albums for term: {term}')
+                            logger.debug('Found %s albums for term: %s', len(albums), term)
                             return albums
         except requests.RequestException as e:
-            self.logger.error(f'Error searching album: {e}')
+            logger.error('Error searching album: %s', e)
 
         return None
 
@@ -1185,12 +1286,12 @@ class PlexConnection:
         :rtype: list | None
         """
 
-        self.logger.debug(f'In function search_song() - term: {term}, artist: {artist}')
+        logger.debug('In function search_song() - term: %s, artist: %s', term, artist)
 
         results = self._aggregate_search_results(term, artist)
 
         if results:
-            self.logger.debug(f'Found {len(results)} songs for term: {term}')
+            logger.debug('Found %s songs for term: %s', len(results), term)
             return results
 
         return None
@@ -1203,21 +1304,15 @@ class PlexConnection:
         :rtype: list | None
         """
 
-        self.logger.debug('In function search_song_simple()')
+        logger.debug('In function search_song_simple()')
 
         # Clean the search term to handle special characters
         term = self._clean_search_term(term)
 
         try:
-            encoded_term = urllib.parse.quote(term)
-            response = requests.get(
-                f"{self.base_url}/hubs/search?query={encoded_term}&limit=20",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._hub_search(term, 20)
 
-            if response.status_code == 200:
-                data = response.json()
+            if data:
                 hubs = data.get('MediaContainer', {}).get('Hub', [])
 
                 for hub in hubs:
@@ -1225,10 +1320,10 @@ class PlexConnection:
                         metadata = hub.get('Metadata', [])
                         if metadata:
                             songs = self._parse_track_metadata(metadata)
-                            self.logger.debug(f'Found {len(songs)} songs for term: {term}')
+                            logger.debug('Found %s songs for term: %s', len(songs), term)
                             return songs
         except requests.RequestException as e:
-            self.logger.error(f'Error searching song: {e}')
+            logger.error('Error searching song: %s', e)
 
         return None
 
@@ -1243,7 +1338,7 @@ class PlexConnection:
         :rtype: list | None
         """
 
-        self.logger.debug(f'In function search_song_from_album() - song: {song_term}, album: {album_term}')
+        logger.debug('In function search_song_from_album() - song: %s, album: %s', song_term, album_term)
 
         # First search for the song
         results = self._aggregate_search_results(song_term)
@@ -1307,11 +1402,11 @@ class PlexConnection:
         # Sort by score descending
         scored_results.sort(key=lambda x: x[0], reverse=True)
 
-        self.logger.debug(f'Found {len(scored_results)} songs for song: {song_term}, album: {album_term}')
+        logger.debug('Found %s songs for song: %s, album: %s', len(scored_results), song_term, album_term)
         
         # Log top results
         for idx, (score, track) in enumerate(scored_results[:3], 1):
-            self.logger.debug(f'  #{idx} [Score: {score:.3f}] "{track.get("title")}" from "{track.get("album")}"')
+            logger.debug('  #%s [Score: %.3f] "%s" from "%s"', idx, score, track.get("title"), track.get("album"))
 
         return [track for score, track in scored_results]
 
@@ -1322,22 +1417,17 @@ class PlexConnection:
         :return: List of track dictionaries
         :rtype: list
         """
-        self.logger.debug(f'Getting tracks for album: {album_id}')
+        logger.debug('Getting tracks for album: %s', album_id)
 
         try:
-            response = requests.get(
-                f"{self.base_url}/library/metadata/{album_id}/children",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._get_json(f"{self.base_url}/library/metadata/{album_id}/children")
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 metadata = data.get('MediaContainer', {}).get('Metadata', [])
                 if metadata:
                     return self._parse_track_metadata(metadata)
         except requests.RequestException as e:
-            self.logger.error(f'Error getting album tracks: {e}')
+            logger.error('Error getting album tracks: %s', e)
 
         return []
 
@@ -1349,18 +1439,13 @@ class PlexConnection:
         :rtype: list
         """
 
-        self.logger.debug('In function albums_by_artist()')
+        logger.debug('In function albums_by_artist()')
 
         albums = []
         try:
-            response = requests.get(
-                f"{self.base_url}/library/metadata/{artist_id}/children",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._get_json(f"{self.base_url}/library/metadata/{artist_id}/children")
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 metadata = data.get('MediaContainer', {}).get('Metadata', [])
                 albums = [{
                     'id': m.get('ratingKey'),
@@ -1368,7 +1453,7 @@ class PlexConnection:
                     'songCount': m.get('leafCount', 0)
                 } for m in metadata]
         except requests.RequestException as e:
-            self.logger.error(f'Error getting albums by artist: {e}')
+            logger.error('Error getting albums by artist: %s', e)
 
         return albums
 
@@ -1380,17 +1465,12 @@ class PlexConnection:
         :rtype: dict
         """
 
-        self.logger.debug('In function get_song_details()')
+        logger.debug('In function get_song_details()')
 
         try:
-            response = requests.get(
-                f"{self.base_url}/library/metadata/{song_id}",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._get_json(f"{self.base_url}/library/metadata/{song_id}")
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 metadata = data.get('MediaContainer', {}).get('Metadata', [{}])[0]
                 
                 # Use helper functions to extract metadata
@@ -1442,7 +1522,7 @@ class PlexConnection:
                     }
                 }
         except requests.RequestException as e:
-            self.logger.error(f'Error getting song details: {e}')
+            logger.error('Error getting song details: %s', e)
 
         return {'song': {}}
 
@@ -1454,17 +1534,12 @@ class PlexConnection:
         :rtype: str
         """
 
-        self.logger.debug('In function get_song_uri()')
+        logger.debug('In function get_song_uri()')
 
         try:
-            response = requests.get(
-                f"{self.base_url}/library/metadata/{song_id}",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._get_json(f"{self.base_url}/library/metadata/{song_id}")
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 metadata = data.get('MediaContainer', {}).get('Metadata', [{}])[0]
                 media = metadata.get('Media', [{}])[0] if metadata.get('Media') else {}
                 parts = media.get('Part', [{}])[0] if media.get('Part') else {}
@@ -1473,7 +1548,7 @@ class PlexConnection:
                 if key:
                     return f"{self.base_url}{key}?X-Plex-Token={self.token}"
         except requests.RequestException as e:
-            self.logger.error(f'Error getting song URI: {e}')
+            logger.error('Error getting song URI: %s', e)
 
         return ''
 
@@ -1486,30 +1561,29 @@ class PlexConnection:
         :rtype: list
         """
 
-        self.logger.debug('In function build_song_list_from_albums()')
+        logger.debug('In function build_song_list_from_albums()')
 
         song_id_list = []
         song_count = 0
 
-        for album in albums:
+        # Album track listings are fetched in parallel batches, but processed
+        # in album order so the result is the same as fetching one at a time
+        for start in range(0, len(albums), MAX_PARALLEL_REQUESTS):
             if length != -1 and song_count >= int(length):
                 break
 
-            try:
-                response = requests.get(
-                    f"{self.base_url}/library/metadata/{album.get('id')}/children",
-                    headers=self.headers,
-                    timeout=10
-                )
+            batch = albums[start:start + MAX_PARALLEL_REQUESTS]
+            urls = [f"{self.base_url}/library/metadata/{album.get('id')}/children" for album in batch]
+
+            for data in self._get_json_many(urls):
+                if length != -1 and song_count >= int(length):
+                    break
 
-                if response.status_code == 200:
-                    data = response.json()
+                if data is not None:
                     metadata = data.get('MediaContainer', {}).get('Metadata', [])
                     for track in metadata:
                         song_id_list.append(track.get('ratingKey'))
                         song_count += 1
-            except requests.RequestException as e:
-                self.logger.error(f'Error getting album tracks: {e}')
 
         return song_id_list
 
@@ -1521,22 +1595,17 @@ class PlexConnection:
         :rtype: list
         """
 
-        self.logger.debug('In function build_song_list_from_playlist()')
+        logger.debug('In function build_song_list_from_playlist()')
 
         song_id_list = []
         try:
-            response = requests.get(
-                f"{self.base_url}/playlists/{playlist_id}/items",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._get_json(f"{self.base_url}/playlists/{playlist_id}/items")
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 metadata = data.get('MediaContainer', {}).get('Metadata', [])
                 song_id_list = [m.get('ratingKey') for m in metadata if m.get('type') == 'track']
         except requests.RequestException as e:
-            self.logger.error(f'Error getting playlist tracks: {e}')
+            logger.error('Error getting playlist tracks: %s', e)
 
         return song_id_list
 
@@ -1548,26 +1617,21 @@ class PlexConnection:
         :rtype: str | None
         """
 
-        self.logger.debug('In function search_playlist()')
+        logger.debug('In function search_playlist()')
 
         # Clean the search term to handle special characters
         term = self._clean_search_term(term)
 
         try:
-            response = requests.get(
-                f"{self.base_url}/playlists",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._get_json(f"{self.base_url}/playlists")
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 metadata = data.get('MediaContainer', {}).get('Metadata', [])
                 for playlist in metadata:
                     if playlist.get('title', '').lower() == term.lower():
                         return playlist.get('ratingKey')
         except requests.RequestException as e:
-            self.logger.error(f'Error searching playlist: {e}')
+            logger.error('Error searching playlist: %s', e)
 
         return None
 
@@ -1579,26 +1643,24 @@ class PlexConnection:
         :rtype: list | None
         """
 
-        self.logger.debug('In function build_random_song_list()')
+        logger.debug('In function build_random_song_list()')
 
         library_key = self._get_music_library_key()
         if not library_key:
             return None
 
         try:
-            response = requests.get(
-                f"{self.base_url}/library/sections/{library_key}/all?type=10&sort=random&limit={count}",
-                headers=self.headers,
-                timeout=10
+            data = self._get_json(
+                f"{self.base_url}/library/sections/{library_key}/all",
+                params={'type': 10, 'sort': 'random', 'limit': count}
             )
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 metadata = data.get('MediaContainer', {}).get('Metadata', [])
                 if metadata:
                     return [m.get('ratingKey') for m in metadata]
         except requests.RequestException as e:
-            self.logger.error(f'Error getting random songs: {e}')
+            logger.error('Error getting random songs: %s', e)
 
         return None
 
@@ -1611,27 +1673,24 @@ class PlexConnection:
         :rtype: list | None
         """
 
-        self.logger.debug('In function build_song_list_from_genre()')
+        logger.debug('In function build_song_list_from_genre()')
 
         library_key = self._get_music_library_key()
         if not library_key:
             return None
 
         try:
-            encoded_genre = urllib.parse.quote(genre)
-            response = requests.get(
-                f"{self.base_url}/library/sections/{library_key}/all?type=10&genre={encoded_genre}&limit={count}",
-                headers=self.headers,
-                timeout=10
+            data = self._get_json(
+                f"{self.base_url}/library/sections/{library_key}/all",
+                params={'type': 10, 'genre': genre, 'limit': count}
             )
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 metadata = data.get('MediaContainer', {}).get('Metadata', [])
                 if metadata:
                     return [m.get('ratingKey') for m in metadata]
         except requests.RequestException as e:
-            self.logger.error(f'Error getting songs by genre: {e}')
+            logger.error('Error getting songs by genre: %s', e)
 
         return None
 
@@ -1642,26 +1701,21 @@ class PlexConnection:
         :rtype: list | None
         """
 
-        self.logger.debug('In function build_song_list_from_favourites()')
+        logger.debug('In function build_song_list_from_favourites()')
 
         library_key = self._get_music_library_key()
         if not library_key:
             return None
 
         try:
-            response = requests.get(
-                f"{self.base_url}/library/sections/{library_key}/all?type=10&userRating>=1",
-                headers=self.headers,
-                timeout=10
-            )
+            data = self._get_json(f"{self.base_url}/library/sections/{library_key}/all?type=10&userRating>=1")
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 metadata = data.get('MediaContainer', {}).get('Metadata', [])
                 if metadata:
                     return [m.get('ratingKey') for m in metadata]
         except requests.RequestException as e:
-            self.logger.error(f'Error getting favorite songs: {e}')
+            logger.error('Error getting favorite songs: %s', e)
 
         return None
 
@@ -1673,16 +1727,15 @@ class PlexConnection:
         :return: None
         """
 
-        self.logger.debug('In function star_entry()')
+        logger.debug('In function star_entry()')
 
         try:
-            requests.put(
+            self.session.put(
                 f"{self.base_url}/library/metadata/{song_id}?userRating=10",
-                headers=self.headers,
                 timeout=10
             )
         except requests.RequestException as e:
-            self.logger.error(f'Error starring entry: {e}')
+            logger.error('Error starring entry: %s', e)
 
     def unstar_entry(self, song_id: str, mode: str) -> None:
         """Remove rating from a song
@@ -1692,16 +1745,15 @@ class PlexConnection:
         :return: None
         """
 
-        self.logger.debug('In function unstar_entry()')
+        logger.debug('In function unstar_entry()')
 
         try:
-            requests.put(
+            self.session.put(
                 f"{self.base_url}/library/metadata/{song_id}?userRating=-1",
-                headers=self.headers,
                 timeout=10
             )
         except requests.RequestException as e:
-            self.logger.error(f'Error unstarring entry: {e}')
+            logger.error('Error unstarring entry: %s', e)
 
     def get_transcoded_song_uri(self, song_id: str, format: str = 'mp3', max_bit_rate: int = 192) -> str:
         """Create a transcoded URI for a given song
@@ -1717,7 +1769,7 @@ class PlexConnection:
         :rtype: str
         """
 
-        self.logger.debug(f'In function get_transcoded_song_uri() - format: {format}, bitrate: {max_bit_rate}')
+        logger.debug('In function get_transcoded_song_uri() - format: %s, bitrate: %s', format, max_bit_rate)
 
         try:
             # Plex universal transcoder endpoint for audio
@@ -1737,11 +1789,11 @@ class PlexConnection:
                 f"&X-Plex-Token={self.token}"
             )
 
-            self.logger.debug(f'Transcoded URI: {transcode_uri}')
+            logger.debug('Transcoded URI: %s', transcode_uri)
             return transcode_uri
 
         except Exception as e:
-            self.logger.error(f'Error creating transcoded URI: {e}')
+            logger.error('Error creating transcoded URI: %s', e)
             return ''
 
     def scrobble(self, track_id: str, time: int) -> None:
@@ -1752,13 +1804,12 @@ class PlexConnection:
         :return: None
         """
 
-        self.logger.debug('In function scrobble()')
+        logger.debug('In function scrobble()')
 
         try:
-            requests.get(
+            self.session.get(
                 f"{self.base_url}/:/scrobble?key={track_id}&identifier=com.plexapp.plugins.library",
-                headers=self.headers,
                 timeout=10
             )
         except requests.RequestException as e:
-            self.logger.error(f'Error scrobbling: {e}')
+            logger.error('Error scrobbling: %s', e)
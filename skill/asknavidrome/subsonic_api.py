@@ -67,7 +67,7 @@ class SubsonicConnection:
             # Fail
             self.logger.error('Failed to connect to Navidrome')
 
-        return self.conn.ping()
+        return status
 
     def scrobble(self, track_id: str, time: int) -> None:
         """Scrobble the given track
@@ -99,18 +99,18 @@ class SubsonicConnection:
 
         if len(playlist_id_list) == 1:
             # We have matched the playlist return it
-            self.logger.debug(f'Found playlist {playlist_id_list[0]}')
+            self.logger.debug('Found playlist %s', playlist_id_list[0])
 
             return playlist_id_list[0]
 
         elif len(playlist_id_list) > 1:
             # More than one result was returned, this should not be possible
-            self.logger.error(f'More than one playlist called {term} was found, multiple playlists with the same name are not supported')
+            self.logger.error('More than one playlist called %s was found, multiple playlists with the same name are not supported', term)
 
             return None
 
         elif len(playlist_id_list) == 0:
-            self.logger.error(f'No playlist matching the name {term} was found!')
+            self.logger.error('No playlist matching the name %s was found!', term)
 
             return None
 
@@ -130,7 +130,7 @@ class SubsonicConnection:
             # Results found
             result_count = len(result_dict['searchResult3']['artist'])
 
-            self.logger.debug(f'Searching artists for term: {term} found {result_count} entries.')
+            self.logger.debug('Searching artists for term: %s found %s entries.', term, result_count)
 
             if result_count > 0:
                 # Results were found
@@ -155,7 +155,7 @@ class SubsonicConnection:
             # Results found
             result_count = len(result_dict['searchResult3']['album'])
 
-            self.logger.debug(f'Searching albums for term: {term} found {result_count} entries.')
+            self.logger.debug('Searching albums for term: %s found %s entries.', term, result_count)
 
             if result_count > 0:
                 # Results were found
@@ -180,7 +180,7 @@ class SubsonicConnection:
             # Results found
             result_count = len(result_dict['searchResult3']['song'])
 
-            self.logger.debug(f'Searching songs for term: {term}, found {result_count} entries.')
+            self.logger.debug('Searching songs for term: %s, found %s entries.', term, result_count)
 
             if result_count > 0:
                 # Results were found
@@ -200,7 +200,7 @@ class SubsonicConnection:
         :rtype: list | None
         """
 
-        self.logger.debug(f'In function search_song_from_album() - song: {song_term}, album: {album_term}')
+        self.logger.debug('In function search_song_from_album() - song: %s, album: %s', song_term, album_term)
 
         # First search for the song
         song_results = self.search_song(song_term)
@@ -254,7 +254,7 @@ class SubsonicConnection:
         # Sort by album match score descending
         scored_results.sort(key=lambda x: x[0], reverse=True)
 
-        self.logger.debug(f'Found {len(scored_results)} songs for song: {song_term}, album: {album_term}')
+        self.logger.debug('Found %s songs for song: %s, album: %s', len(scored_results), song_term, album_term)
 
         return [song for score, song in scored_results]
 
@@ -403,7 +403,7 @@ class SubsonicConnection:
 
         # Note the use of title() to capitalise the first letter of each word in the genre
         # without this the genres do not match the strings returned by the API.
-        self.logger.debug(f'Searching for {genre.title()} music')
+        self.logger.debug('Searching for %s music', genre.title())
         songs_from_genre = self.conn.getSongsByGenre(genre.title(), count).get('songsByGenre').get('song')
 
         if len(songs_from_genre) > 0:
@@ -445,7 +445,7 @@ class SubsonicConnection:
         :rtype: str
         """
 
-        self.logger.debug(f'In function get_cover_art_url() - id: {cover_art_id}')
+        self.logger.debug('In function get_cover_art_url() - id: %s', cover_art_id)
 
         salt = secrets.token_hex(16)
         auth_token = md5(self.passwd.encode() + salt.encode())
@@ -517,7 +517,7 @@ class SubsonicConnection:
         :rtype: str
         """
 
-        self.logger.debug(f'In function get_transcoded_song_uri() - format: {format}, bitrate: {max_bit_rate}')
+        self.logger.debug('In function get_transcoded_song_uri() - format: %s, bitrate: %s', format, max_bit_rate)
 
         salt = secrets.token_hex(16)
         auth_token = md5(self.passwd.encode() + salt.encode())
@@ -1,3 +1,5 @@
+import sys
+
 # Default fallback image URL
 DEFAULT_ART_URL = 'https://github.com/navidrome/navidrome/raw/master/resources/logo-192x192.png'
 
@@ -6,6 +8,13 @@ class Track:
     """An object that represents an audio track
     """
 
+    # A queue can hold hundreds of tracks which are copied into the buffer
+    # and history and pickled across the queue manager, so avoid a per
+    # instance __dict__
+    __slots__ = ('id', 'artist', 'artist_id', 'title', 'album', 'album_id', 'track_no', 'year',
+                 'genre', 'duration', 'bitrate', 'uri', 'offset', 'previous_id', 'source',
+                 'playback_failed', 'transcoded', 'cover_art_url', 'background_url')
+
     def __init__(self,
                  id: str = '', title: str = '', artist: str = '', artist_id: str = '',
                  album: str = '', album_id: str = '', track_no: int = 0, year: int = 0,
@@ -55,3 +64,37 @@ class Track:
         self.transcoded: bool = transcoded
         self.cover_art_url: str = cover_art_url or DEFAULT_ART_URL
         self.background_url: str = background_url or DEFAULT_ART_URL
+
+    @classmethod
+    def from_song_data(cls, song_data: dict, uri: str, source: str) -> 'Track':
+        """Create a Track from the song details returned by a media server
+
+        :param dict song_data: The 'song' dictionary from get_song_details()
+        :param str uri: The song's URI for streaming
+        :param str source: The media source ('navidrome' or 'plex')
+        :return: A new Track object
+        :rtype: Track
+        """
+
+        # Artist, album and genre repeat across most tracks in a queue,
+        # interning them shares one string object and lets pickle send it
+        # once per batch
+        return cls(
+            id=song_data.get('id'),
+            title=song_data.get('title'),
+            artist=sys.intern(song_data.get('artist') or ''),
+            artist_id=song_data.get('artistId'),
+            album=sys.intern(song_data.get('album') or ''),
+            album_id=song_data.get('albumId'),
+            track_no=song_data.get('track'),
+            year=song_data.get('year'),
+            genre=sys.intern(song_data.get('genre') or ''),
+            duration=song_data.get('duration'),
+            bitrate=song_data.get('bitRate'),
+            uri=uri,
+            offset=0,
+            previous_id=None,
+            source=source,
+            cover_art_url=song_data.get('coverPosterUrl', ''),
+            background_url=song_data.get('backgroundUrl', '')
+        )